@@ -0,0 +1,356 @@
+# -*- coding: utf-8 -*-
+'''
+Texas A&M University Sounding Rocketry Team
+SRT-9 | 2021-2022
+
+%-------------------------------------------------------------%
+                            TAMU SRT
+  _____                      __  _____          __           __
+ / ___/______  __ _____  ___/ / / ___/__  ___  / /________  / /
+/ (_ / __/ _ \/ // / _ \/ _  / / /__/ _ \/ _ \/ __/ __/ _ \/ /
+\___/_/  \___/\_,_/_//_/\_,_/  \___/\___/_//_/\__/_/  \___/_/
+
+%-------------------------------------------------------------%
+
+Filepath:
+    gc/srt_gc_launchGui/srt_gc_launchBench.py
+
+Developers:
+    (C) Ground Control Team    20261018
+    (L) Ground Control Team    ########
+
+Description:
+    Headless ingest benchmark; runs main GUI on Qt "offscreen" platform w/ synthetic packets.
+    Per configuration (channel count, window length):
+     - stage cost per packet: parse, store, extrapolation, render
+     - throughput through parse --> render at simulated packet & frame cadence
+     - throughput through LinkThread (PollLink) --> dataSig --> dataUpdate (live event loop, as connected GUI)
+     - peak RSS
+    Once per run: N2O vapor pressure, table lookup vs. closed form (cost & max. error)
+
+    CLI execution: "python3 srt_gc_launchBench.py --channels 6,12 --window 60,600 --out bench.json"
+
+Input(s):
+    <None>
+
+Output(s):
+    *.json    machine-readable benchmark results
+'''
+
+# Installed modules --> Utilities
+import os
+import sys
+import json
+import time
+import threading
+import platform
+import argparse
+import numpy as np
+
+os.environ.setdefault("QT_QPA_PLATFORM","offscreen") # Before any Qt import
+
+try:
+    import resource
+except ImportError:
+    resource = None # Windows --> no peak RSS
+
+# Installed modules --> PyQt related
+from PyQt5.QtCore import QTimer
+from PyQt5.QtWidgets import QApplication
+import pyqtgraph as pg
+
+class Synth():
+
+    '''
+    Synthetic Packet Source
+     - Lines: "stHH:MM:SS.ffffff,pt...,pc...,..." w/ aux channels "aa", "ab", ... beyond standard six
+     - read() & in_waiting --> stands in for pyserial port, never blocks
+    '''
+
+    base = ["st","pt","pc","tt","tc","ta"]
+
+    def __init__(self,nChan,rate):
+
+        self.rate = rate
+        self.name = list(self.base[0:nChan])
+        self.n    = 0
+        self.pend = bytearray()
+
+        # Two-letter aux codes; first letters a-o never clash w/ standard codes
+        for i in range(nChan - len(self.name)):
+            self.name.append(chr(ord('a') + i//26) + chr(ord('a') + i % 26))
+
+    def lines(self,count):
+
+        '''
+        Next count Packets (list of str)
+        '''
+
+        t     = (self.n + np.arange(count))/self.rate + 12*3600
+        value = 400 + 10*np.sin(t[:,None]*0.1 + np.arange(len(self.name) - 1)) # Smooth & varying
+
+        out = []
+
+        for i in range(count):
+
+            sec   = t[i]
+            stamp = "%02d:%02d:%09.6f" % (int(sec//3600) % 24,int(sec//60) % 60,sec % 60)
+            field = ["st" + stamp]
+
+            for j in range(1,len(self.name)):
+                field.append(self.name[j] + "%.2f" % value[i,j - 1])
+
+            out.append(','.join(field))
+
+        self.n += count
+
+        return out
+
+    @property
+    def in_waiting(self):
+
+        return 4096
+
+    def read(self,size=1):
+
+        if (len(self.pend) < size):
+            self.pend += ('\n'.join(self.lines(200)) + '\n').encode("ascii")
+
+        text = bytes(self.pend[:size])
+        del self.pend[:size]
+
+        return text
+
+    def write(self,data):
+
+        return len(data)
+
+    def close(self):
+
+        pass
+
+def peakRss():
+
+    '''
+    Peak Resident Set Size [MB] (process lifetime), None if unavailable
+    '''
+
+    if (resource is None):
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # Linux --> KB, macOS --> bytes
+    return peak/1024.0**2 if (sys.platform == "darwin") else peak/1024.0
+
+def configure(gui,nChan,window,rate):
+
+    '''
+    Rebuild GUI Data Storage for Benchmark Configuration
+    '''
+
+    if (nChan < len(Synth.base)):
+        raise ValueError("Channel count must include " + ','.join(Synth.base))
+
+    synth = Synth(nChan,rate)
+
+    gui.dataName = synth.name
+    gui.dataTime = window
+    gui.dataRate = rate
+
+    gui.dataAlloc()
+
+    return synth
+
+def stages(app,gui,nChan,window,rate,duration):
+
+    '''
+    Per-Stage Cost w/ Simulated Packet & Frame Cadence
+    '''
+
+    synth = configure(gui,nChan,window,rate)
+    batch = max(int(rate*gui.batchTime),1)
+    nPack = int(rate*duration)
+    frame = max(int(rate/gui.frameRate),1) # Packets per rendered frame
+
+    cost  = {"parse": 0.0, "store": 0.0, "extrap": 0.0, "render": 0.0}
+    total = 0.0
+    done  = 0
+    due   = frame
+
+    while (done < nPack):
+
+        lines = synth.lines(min(batch,nPack - done))
+
+        t0 = time.perf_counter()
+        block = gui.parser.parseLines(lines)
+        t1 = time.perf_counter()
+        gui.data.extend(block)
+        for tier in gui.tier:
+            tier.extend(block)
+        gui.trend.extend(block)
+        t2 = time.perf_counter()
+
+        cost["parse"] += t1 - t0
+        cost["store"] += t2 - t1
+        total         += t2 - t0
+        done          += len(lines)
+
+        if (done >= due):
+
+            t0 = time.perf_counter()
+            gui.sensorRender()
+            t1 = time.perf_counter()
+            gui.plotRender()
+            app.processEvents() # Paint
+            t2 = time.perf_counter()
+
+            cost["extrap"] += t1 - t0
+            cost["render"] += t2 - t1
+            total          += t2 - t0
+            due            += frame
+
+    result = {"packets": done, "packetsPerSec": done/total}
+
+    for name in cost:
+        result[name + "UsPerPacket"] = 1e6*cost[name]/done
+
+    return result
+
+def vapor(tools,sizes,repeat=20):
+
+    '''
+    N2O Vapor Pressure: Table Lookup vs. Closed Form, per Array Size
+    '''
+
+    result = []
+    tools.vapInit()
+
+    for n in sizes:
+
+        T = np.linspace(tools.vapRange[0],tools.vapRange[1],n) # Liquid range, °F
+        entry = {"size": n}
+
+        for name,func in [("closed",tools.vapPress),("table",tools.vapLookup)]:
+
+            t0 = time.perf_counter()
+            for i in range(repeat):
+                func(T)
+            entry[name + "UsPerCall"] = 1e6*(time.perf_counter() - t0)/repeat
+
+        entry["maxRelErr"] = float(np.max(np.abs(tools.vapLookup(T)/tools.vapPress(T) - 1)))
+        result.append(entry)
+
+    # Scalar path --> one readout per frame
+    t0 = time.perf_counter()
+    for i in range(repeat*100):
+        tools.vapPress(70.0)
+    scalar = {"size": 1, "closedUsPerCall": 1e6*(time.perf_counter() - t0)/(repeat*100)}
+
+    t0 = time.perf_counter()
+    for i in range(repeat*100):
+        tools.vapLookup(70.0)
+    scalar["tableUsPerCall"] = 1e6*(time.perf_counter() - t0)/(repeat*100)
+
+    return {"tableErrBound": tools.vapErr, "scalar": scalar, "array": result}
+
+def pipeline(app,gui,nChan,window,rate,seconds):
+
+    '''
+    Max Sustained Packet Rate: GUI's LinkThread --> dataSig --> dataUpdate, render timer live
+    '''
+
+    from srt_gc_launchLink import PollLink
+
+    synth = configure(gui,nChan,window,rate)
+    count = [0]
+
+    def tally(lines,*stamps):
+        count[0] += len(lines)
+
+    # Same link thread & slots as a connected session; link name never matches linkName
+    thread = gui.linkThread
+    thread.dataSig.connect(tally)
+
+    # Producer stopped on time from outside GUI thread (GUI timers starve behind queued batches)
+    stop = threading.Timer(seconds,thread.remove,["Bench"])
+
+    t0 = time.perf_counter()
+    thread.add(PollLink("Bench",synth))
+    stop.start()
+    QTimer.singleShot(int(1000*seconds),app.quit)
+    app.exec_()
+    elapsed = time.perf_counter() - t0
+
+    stop.join()
+
+    result = {"packets": count[0], "packetsPerSec": count[0]/elapsed, "seconds": elapsed}
+
+    # Drain batches still queued for this configuration
+    time.sleep(0.1)
+    app.processEvents()
+    thread.dataSig.disconnect(tally)
+
+    return result
+
+if (__name__ == '__main__'):
+
+    '''
+    Executive Control
+    '''
+
+    parser = argparse.ArgumentParser(description="SRT GUI headless ingest benchmark")
+    parser.add_argument("--channels",type=str,default="6,12,24",help="channel counts (min. 6, incl. st)")
+    parser.add_argument("--window",type=str,default="60,600",help="live window lengths [sec]")
+    parser.add_argument("--rate",type=float,default=200,help="synthetic packet rate [Hz]")
+    parser.add_argument("--duration",type=float,default=120,help="simulated session per config [sec]")
+    parser.add_argument("--pipeline",type=float,default=3,help="live LinkThread run per config [sec] (0 --> off)")
+    parser.add_argument("--out",type=str,default="bench_results.json",help="output file")
+    args = parser.parse_args()
+
+    from srt_gc_launchGui import Gui
+
+    app = QApplication(sys.argv)
+    gui = Gui()
+
+    # First paint --> plots & threads built (lazy startup)
+    while (not gui.boot.text):
+        app.processEvents()
+
+    gui.renderTimer.stop() # Stage timing drives renders itself
+
+    vap = vapor(gui.tools,[100,10000,1000000])
+    print(json.dumps(vap))
+
+    results = []
+
+    for nChan in [int(n) for n in args.channels.split(',')]:
+        for window in [float(w) for w in args.window.split(',')]:
+
+            entry = {"channels": nChan, "window": window, "rate": args.rate}
+            entry["stages"] = stages(app,gui,nChan,window,args.rate,args.duration)
+
+            if (args.pipeline > 0):
+                gui.renderTimer.start()
+                entry["pipeline"] = pipeline(app,gui,nChan,window,args.rate,args.pipeline)
+                gui.renderTimer.stop()
+
+            entry["peakRssMB"] = peakRss()
+            results.append(entry)
+
+            print(json.dumps(entry))
+            sys.stdout.flush()
+
+    report = {"version": gui.version,
+              "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+              "platform": platform.platform(),
+              "python": platform.python_version(),
+              "numpy": np.__version__,
+              "pyqtgraph": pg.__version__,
+              "vapor": vap,
+              "results": results}
+
+    with open(args.out,'w') as outFile:
+        json.dump(report,outFile,indent=2)
+
+    gui.writer.stop()
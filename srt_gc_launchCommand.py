@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+'''
+Texas A&M University Sounding Rocketry Team
+SRT-9 | 2021-2022
+
+%-------------------------------------------------------------%
+                            TAMU SRT
+  _____                      __  _____          __           __
+ / ___/______  __ _____  ___/ / / ___/__  ___  / /________  / /
+/ (_ / __/ _ \/ // / _ \/ _  / / /__/ _ \/ _ \/ __/ __/ _ \/ /
+\___/_/  \___/\_,_/_//_/\_,_/  \___/\___/_//_/\__/_/  \___/_/
+
+%-------------------------------------------------------------%
+
+Filepath:
+    gc/srt_gc_launchGui/srt_gc_launchCommand.py
+
+Developers:
+    (C) Ground Control Team    20261018
+    (L) Ground Control Team    ########
+
+Description:
+    Command queue on the link event loop.
+     - Safety commands (State.commSafe) sent ahead of queued routine commands; abort drops them
+     - Routine sends spaced by a minimum gap (slow XBee links); safety commands never wait
+     - Each command matched to its State.ackDict echo --> command to acknowledge latency
+     - No echo within ack time --> resent, up to retries, then reported as timed out
+     - Newer command on same state (ignArm --> ignDisarm) supersedes queued & unacknowledged one
+
+Input(s):
+    <None>
+
+Output(s):
+    <None>
+'''
+
+# Installed modules --> Utilities
+import time
+import heapq
+import asyncio
+
+# Program modules
+from srt_gc_launchState import State
+
+class Command():
+
+    '''
+    Queued Command
+    '''
+
+    def __init__(self,seq,link,name,data):
+
+        self.seq   = seq
+        self.link  = link # Link name to send on
+        self.name  = name # Command name (State.btnComm)
+        self.data  = data # Bytes written
+        self.echo  = State.ackDict.get(name,()) # Acknowledging state code(s)
+        self.state = State.ackState.get(name)   # State set, None if report only
+        self.undo  = State.ackUndo.get(name,()) # Echo code(s) of opposite command
+        self.prio  = 0 if (name in State.commSafe) else 1
+        self.tries = 0
+        self.sent  = None # time.perf_counter of last send
+        self.timer = None # Ack timeout handle
+
+    def __lt__(self,other):
+
+        return (self.prio,self.seq) < (other.prio,other.seq)
+
+class CommandQueue():
+
+    '''
+    Prioritized, Rate-Limited Command Sender w/ Echo Acknowledgement
+     - Called on owner's event loop only
+     - owner.commWrite(link, data) --> True if written; owner.commSig(name, event, latency, tries)
+     - Events: SENT, RETRY, ACK (latency in sec), TIMEOUT, DROPPED, SUPERSEDED
+    '''
+
+    def __init__(self,owner,gap=0.1,ackTime=1.0,retries=2):
+
+        self.owner   = owner
+        self.gap     = gap     # Min. time between sends (sec)
+        self.ackTime = ackTime # Max. wait for echo per send (sec)
+        self.retries = retries # Resends before timeout reported
+
+        self.heap  = []   # Commands awaiting send
+        self.wait  = []   # Commands sent, awaiting echo (oldest first)
+        self.seq   = 0
+        self.last  = None # Last send (time.perf_counter)
+        self.timer = None # Rate limit handle
+
+    def put(self,link,name,data):
+
+        '''
+        Queue Command; safety commands jump the queue
+        '''
+
+        comm = Command(self.seq,link,name,data)
+        self.seq += 1
+
+        # Abort --> routine commands not yet sent (or awaiting resend) never go out
+        if (name == "abort"):
+            self.remove(lambda old: old.prio > 0)
+
+        # Same state --> older command (or its resends) would undo this one
+        if (comm.state is not None):
+            self.remove(lambda old: old.state == comm.state,"SUPERSEDED")
+
+        heapq.heappush(self.heap,comm)
+        self.pump()
+
+    def pump(self):
+
+        '''
+        Send Next Command Now, or Once Gap Elapsed
+        '''
+
+        if (not self.heap):
+            return
+
+        delay = 0 if (self.last is None) else self.last + self.gap - time.perf_counter()
+
+        if (delay > 0) and (self.heap[0].prio > 0):
+
+            if (self.timer is None):
+                self.timer = asyncio.get_event_loop().call_later(delay,self.fire)
+
+        else:
+
+            if (self.timer is not None):
+                self.timer.cancel()
+
+            self.fire()
+
+    def fire(self):
+
+        self.timer = None
+        comm       = heapq.heappop(self.heap)
+
+        comm.tries += 1
+        comm.sent   = time.perf_counter()
+        self.last   = comm.sent
+
+        written = self.owner.commWrite(comm.link,comm.data)
+
+        if (written):
+            self.owner.commSig.emit(comm.name,"SENT" if (comm.tries == 1) else "RETRY",0.0,comm.tries)
+
+        # Unwritten (link down, reconnecting) --> retried like a lost echo
+        if (comm.echo):
+            self.wait.append(comm)
+            comm.timer = asyncio.get_event_loop().call_later(self.ackTime,self.expire,comm)
+        elif (not written):
+            self.owner.commSig.emit(comm.name,"DROPPED",0.0,comm.tries)
+
+        self.pump()
+
+    def expire(self,comm):
+
+        '''
+        No Echo in Time --> resend at same priority & place, or report
+        '''
+
+        self.wait.remove(comm)
+
+        if (comm.tries <= self.retries):
+            heapq.heappush(self.heap,comm)
+            self.pump()
+        else:
+            self.owner.commSig.emit(comm.name,"TIMEOUT",0.0,comm.tries)
+
+    def match(self,lines,read):
+
+        '''
+        State Echoes --> acknowledge oldest matching command (one echo, one command)
+         - Opposite echo (e.g. disarmed while arm awaits ack) --> waiting command not resent
+        '''
+
+        if (not self.wait):
+            return
+
+        for text in lines:
+
+            if (text[0:1] != 'x'):
+                continue
+
+            for comm in self.wait:
+
+                if (text in comm.echo):
+
+                    comm.timer.cancel()
+                    self.wait.remove(comm)
+                    self.owner.commSig.emit(comm.name,"ACK",read - comm.sent,comm.tries)
+                    break
+
+            # Only commands sent before the echo was read; unsent ones may still change state
+            self.remove(lambda comm: (text in comm.undo) and (comm.sent is not None) and (comm.sent < read),"SUPERSEDED")
+
+    def drop(self,link):
+
+        '''
+        Link Removed --> forget its queued & unacknowledged commands
+        '''
+
+        self.remove(lambda comm: comm.link == link)
+
+    def remove(self,test,event="DROPPED"):
+
+        '''
+        Drop Queued & Unacknowledged Commands Where test(comm)
+        '''
+
+        for comm in self.heap + self.wait:
+            if (test(comm)):
+
+                if (comm.timer is not None):
+                    comm.timer.cancel()
+
+                self.owner.commSig.emit(comm.name,event,0.0,comm.tries)
+
+        self.heap = [comm for comm in self.heap if (not test(comm))]
+        self.wait = [comm for comm in self.wait if (not test(comm))]
+        heapq.heapify(self.heap)
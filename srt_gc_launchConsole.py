@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+'''
+Texas A&M University Sounding Rocketry Team
+SRT-9 | 2021-2022
+
+%-------------------------------------------------------------%
+                            TAMU SRT
+  _____                      __  _____          __           __
+ / ___/______  __ _____  ___/ / / ___/__  ___  / /________  / /
+/ (_ / __/ _ \/ // / _ \/ _  / / /__/ _ \/ _ \/ __/ __/ _ \/ /
+\___/_/  \___/\_,_/_//_/\_,_/  \___/\___/_//_/\__/_/  \___/_/
+
+%-------------------------------------------------------------%
+
+Filepath:
+    gc/srt_gc_launchGui/srt_gc_launchConsole.py
+
+Developers:
+    (C) Ground Control Team    20261018
+    (L) Ground Control Team    ########
+
+Description:
+    Bounded serial output console.
+     - Fixed-capacity line rings per filter (all, data, state, other); oldest lines dropped
+     - Fixed-height rows --> view lays out & draws visible rows only; appends & drops signalled per batch
+     - Pause freezes a snapshot; filter switch re-points the view, no text rebuilt
+
+Input(s):
+    <None>
+
+Output(s):
+    <None>
+'''
+
+# Installed modules --> PyQt related
+from PyQt5 import QtGui
+from PyQt5.QtCore import (Qt, QAbstractListModel, QModelIndex)
+from PyQt5.QtWidgets import (QTableView, QHeaderView, QAbstractItemView)
+
+class LineRing():
+
+    '''
+    Fixed-Capacity Line Ring; O(1) indexed access, oldest first
+    '''
+
+    def __init__(self,capacity):
+
+        self.capacity = int(capacity)
+        self.buf      = [None]*self.capacity
+        self.start    = 0 # Index of oldest line
+        self.count    = 0
+
+    def __len__(self):
+
+        return self.count
+
+    def __getitem__(self,i):
+
+        return self.buf[(self.start + i) % self.capacity]
+
+    def drop(self,n):
+
+        '''
+        Remove n Oldest Lines
+        '''
+
+        n = min(n,self.count)
+
+        self.start  = (self.start + n) % self.capacity
+        self.count -= n
+
+    def append(self,lines):
+
+        '''
+        Append Lines (caller drops first to make room)
+        '''
+
+        for text in lines:
+            self.buf[(self.start + self.count) % self.capacity] = text
+            self.count += 1
+
+    def extend(self,lines):
+
+        '''
+        Append Lines, Dropping Oldest to Make Room
+        '''
+
+        lines = lines[-self.capacity:]
+
+        self.drop(max(self.count + len(lines) - self.capacity,0))
+        self.append(lines)
+
+    def snapshot(self):
+
+        return [self[i] for i in range(self.count)]
+
+class LineModel(QAbstractListModel):
+
+    '''
+    Read-Only List Model Over a LineRing (or frozen list)
+    '''
+
+    def __init__(self,lines):
+
+        QAbstractListModel.__init__(self)
+
+        self.lines = lines
+
+    def rowCount(self,parent=QModelIndex()):
+
+        return 0 if (parent.isValid()) else len(self.lines)
+
+    def data(self,index,role=Qt.DisplayRole):
+
+        if (role == Qt.DisplayRole) and (index.isValid()):
+            return self.lines[index.row()]
+
+        return None
+
+    def point(self,lines):
+
+        '''
+        Show Different Line Source (filter, pause) --> view reset, no copy
+        '''
+
+        self.beginResetModel()
+        self.lines = lines
+        self.endResetModel()
+
+class Console(QTableView):
+
+    '''
+    Bounded, Virtualized Line Console
+    '''
+
+    filterName = ["All","Data","State","Other"]
+
+    def __init__(self,parent=None,capacity=10000):
+
+        QTableView.__init__(self,parent)
+
+        self.ring   = {}
+        self.paused = False
+        self.shown  = "All"
+
+        for name in self.filterName:
+            self.ring[name] = LineRing(capacity)
+
+        self.lineModel = LineModel(self.ring[self.shown])
+        self.setModel(self.lineModel)
+
+        # One column, fixed row height --> layout cost independent of line count
+        # (QListView re-lays out every row on insert)
+        font = QtGui.QFontDatabase.systemFont(QtGui.QFontDatabase.FixedFont)
+        self.setFont(font)
+
+        self.horizontalHeader().hide()
+        self.horizontalHeader().setStretchLastSection(True)
+        self.verticalHeader().hide()
+        self.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.verticalHeader().setDefaultSectionSize(QtGui.QFontMetrics(font).height() + 2)
+
+        self.setShowGrid(False)
+        self.setWordWrap(False)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.setSelectionMode(QAbstractItemView.ExtendedSelection)
+
+    def add(self,lines):
+
+        '''
+        Append Batch of Lines; view notified once per batch
+        '''
+
+        split = {"All": lines, "Data": [], "State": [], "Other": []}
+
+        for text in lines:
+
+            if (text[0:2] == "st"):
+                split["Data"].append(text)
+            elif (text[0:1] == 'x'):
+                split["State"].append(text)
+            else:
+                split["Other"].append(text)
+
+        for name in self.filterName:
+
+            new = split[name][-self.ring[name].capacity:]
+
+            if (not new):
+                continue
+
+            ring = self.ring[name]
+            drop = max(len(ring) + len(new) - ring.capacity,0)
+            live = (name == self.shown) and (not self.paused)
+
+            if (drop > 0):
+
+                if (live):
+                    self.lineModel.beginRemoveRows(QModelIndex(),0,drop - 1)
+
+                ring.drop(drop)
+
+                if (live):
+                    self.lineModel.endRemoveRows()
+
+            if (live):
+                self.lineModel.beginInsertRows(QModelIndex(),len(ring),len(ring) + len(new) - 1)
+
+            ring.append(new)
+
+            if (live):
+                self.lineModel.endInsertRows()
+
+        if (not self.paused):
+            self.scrollToBottom()
+
+    def setFilter(self,name):
+
+        '''
+        Show One Line Category (filterName)
+        '''
+
+        self.shown = name
+
+        if (not self.paused):
+            self.lineModel.point(self.ring[name])
+            self.scrollToBottom()
+        else:
+            self.lineModel.point(self.ring[name].snapshot())
+
+    def setPaused(self,paused):
+
+        '''
+        Pause --> frozen snapshot, free scrolling; resume --> live & follow newest
+        '''
+
+        self.paused = paused
+
+        if (paused):
+            self.lineModel.point(self.ring[self.shown].snapshot())
+        else:
+            self.lineModel.point(self.ring[self.shown])
+            self.scrollToBottom()
+
+    def clear(self):
+
+        for name in self.filterName:
+            self.ring[name].drop(len(self.ring[name]))
+
+        self.setPaused(self.paused)
@@ -0,0 +1,679 @@
+# -*- coding: utf-8 -*-
+'''
+Texas A&M University Sounding Rocketry Team
+SRT-9 | 2021-2022
+
+%-------------------------------------------------------------%
+                            TAMU SRT
+  _____                      __  _____          __           __
+ / ___/______  __ _____  ___/ / / ___/__  ___  / /________  / /
+/ (_ / __/ _ \/ // / _ \/ _  / / /__/ _ \/ _ \/ __/ __/ _ \/ /
+\___/_/  \___/\_,_/_//_/\_,_/  \___/\___/_//_/\__/_/  \___/_/
+
+%-------------------------------------------------------------%
+
+Filepath:
+    gc/srt_gc_launchGui/srt_gc_launchData.py
+
+Developers:
+    (C) Ground Control Team    20261018
+    (L) Ground Control Team    ########
+
+Description:
+    Telemetry data storage; fixed-capacity buffers backing live plots & readouts
+
+Input(s):
+    <None>
+
+Output(s):
+    ./data/*.bin    binary columnar data archive
+'''
+
+# Installed modules --> Utilities
+import os
+import numpy as np
+
+class RingBuffer():
+
+    '''
+    Fixed-Capacity Telemetry Ring Buffer
+     - Struct-of-arrays: one contiguous 2-D float64 block, one row per channel
+     - Each sample written twice (p & p + capacity) so chronological views are plain slices
+     - Optional time window trims oldest samples against key channel (amortized O(1))
+    '''
+
+    def __init__(self,name,capacity,window=None,key=None):
+
+        self.name     = list(name)
+        self.index    = {}
+        self.capacity = int(capacity)
+        self.window   = window # Max age (key channel units) kept in view; None --> capacity only
+        self.key      = key    # Channel used for window trimming, e.g. "st"
+
+        for i in range(len(self.name)):
+            self.index[self.name[i]] = i
+
+        self.block = np.zeros((len(self.name),2*self.capacity),dtype=np.float64)
+        self.clear()
+
+    def clear(self):
+
+        '''
+        Reset Buffer (keeps allocation)
+        '''
+
+        self.pos    = -1 # Write position of newest sample
+        self.length = 0  # No. samples in chronological view
+
+    def __len__(self):
+
+        return self.length
+
+    def __getattr__(self,name):
+
+        # Only called for missing attributes --> channel views, e.g. self.data.st
+        index = self.__dict__.get("index")
+
+        if (index is not None) and (name in index):
+            return self.view(name)
+
+        raise AttributeError(name)
+
+    def append(self,row):
+
+        '''
+        Append One Sample (values in channel order)
+        '''
+
+        self.pos = (self.pos + 1) % self.capacity
+
+        self.block[:,self.pos]                 = row
+        self.block[:,self.pos + self.capacity] = row
+
+        if (self.length < self.capacity):
+            self.length += 1
+
+        self.trim()
+
+    def extend(self,rows):
+
+        '''
+        Append Block of Samples (n x channels, chronological)
+        '''
+
+        rows = np.asarray(rows,dtype=np.float64).reshape(-1,len(self.name))[-self.capacity:]
+        n    = len(rows)
+
+        if (n == 0):
+            return
+
+        col = (self.pos + 1 + np.arange(n)) % self.capacity
+
+        self.block[:,col]                 = rows.T
+        self.block[:,col + self.capacity] = rows.T
+
+        self.pos    = col[-1]
+        self.length = min(self.length + n,self.capacity)
+
+        self.trim()
+
+    def trim(self):
+
+        '''
+        Drop Samples Older Than Time Window
+        '''
+
+        if (self.window is None) or (self.key is None):
+            return
+
+        key    = self.view(self.key)
+        oldest = key[-1] - self.window
+        drop   = np.searchsorted(key,oldest) # Key channel ascending in time
+
+        self.length -= min(drop,self.length - 1)
+
+    def view(self,name):
+
+        '''
+        Chronological Zero-Copy View of One Channel
+        '''
+
+        end = self.pos + self.capacity + 1
+
+        return self.block[self.index[name],end - self.length:end]
+
+    def views(self):
+
+        '''
+        Chronological Zero-Copy View of All Channels (2-D)
+        '''
+
+        end = self.pos + self.capacity + 1
+
+        return self.block[:,end - self.length:end]
+
+class TierBuffer():
+
+    '''
+    Downsampled History Tier
+     - Fixed-width time bins on key channel; mean, min & max of every channel per bin
+     - Open bin accumulated incrementally, closed bins appended to ring buffers
+    '''
+
+    def __init__(self,name,binTime,span,key="st"):
+
+        self.name     = list(name)
+        self.binTime  = binTime # Bin width (key channel units)
+        self.span     = span    # History kept (key channel units)
+        self.key      = self.name.index(key)
+        capacity      = int(np.ceil(span/binTime))
+
+        self.mean = RingBuffer(self.name,capacity)
+        self.min  = RingBuffer(self.name,capacity)
+        self.max  = RingBuffer(self.name,capacity)
+
+        self.clear()
+
+    def clear(self):
+
+        '''
+        Reset Tier (keeps allocation)
+        '''
+
+        self.mean.clear()
+        self.min.clear()
+        self.max.clear()
+
+        self.bin   = None # Index of open bin
+        self.count = 0
+        self.sum   = np.zeros(len(self.name))
+        self.lo    = np.full(len(self.name),np.inf)
+        self.hi    = np.full(len(self.name),-np.inf)
+
+    def __len__(self):
+
+        return len(self.mean)
+
+    def close(self):
+
+        '''
+        Move Open Bin Into History
+        '''
+
+        if (self.count > 0):
+
+            self.mean.append(self.sum/self.count)
+            self.min.append(self.lo)
+            self.max.append(self.hi)
+
+        self.count = 0
+        self.sum[:] = 0
+        self.lo[:]  = np.inf
+        self.hi[:]  = -np.inf
+
+    def extend(self,rows):
+
+        '''
+        Accumulate Block of Samples (n x channels, chronological)
+        '''
+
+        rows = np.asarray(rows,dtype=np.float64).reshape(-1,len(self.name))
+
+        if (len(rows) == 0):
+            return
+
+        # Split block into runs of samples sharing one bin
+        index = np.floor(rows[:,self.key]/self.binTime)
+        edge  = np.flatnonzero(np.diff(index)) + 1
+        start = np.concatenate(([0],edge))
+        stop  = np.concatenate((edge,[len(rows)]))
+
+        for i in range(len(start)):
+
+            run = rows[start[i]:stop[i]]
+
+            if (index[start[i]] != self.bin):
+                self.close()
+                self.bin = index[start[i]]
+
+            self.count += len(run)
+            self.sum   += run.sum(axis=0)
+            self.lo     = np.minimum(self.lo,run.min(axis=0))
+            self.hi     = np.maximum(self.hi,run.max(axis=0))
+
+    def envelope(self,name):
+
+        '''
+        Min/Max Envelope of One Channel --> (key, value) w/ two points per bin
+        '''
+
+        x = np.repeat(self.mean.view(self.name[self.key]),2)
+        y = np.column_stack((self.min.view(name),self.max.view(name))).ravel()
+
+        return x,y
+
+class Trend():
+
+    '''
+    Incremental Least-Squares Trend (forecast readouts)
+     - Per lookback window: running sums n, Σt, Σt², and Σx, Σtx per channel
+     - Samples added on arrival, subtracted on leaving window --> O(1) per packet
+     - Sums rebuilt from stored samples every capacity samples (bounds float drift)
+    '''
+
+    def __init__(self,name,capacity,windows,key="st"):
+
+        self.name    = list(name)
+        self.key     = self.name.index(key)
+        self.windows = np.asarray(windows,dtype=np.float64) # Lookback (key channel units)
+        self.data    = RingBuffer(self.name,capacity)       # Samples still inside some window
+
+        self.clear()
+
+    def clear(self):
+
+        '''
+        Reset Sums & Samples (keeps allocation)
+        '''
+
+        nWin  = len(self.windows)
+        nChan = len(self.name)
+
+        self.data.clear()
+
+        self.count  = 0 # Samples appended, ever
+        self.since  = 0 # Samples appended since last rebuild
+        self.origin = 0 # Time origin of sums (key channel units), limits cancellation
+        self.first  = np.zeros(nWin,dtype=np.int64) # Absolute index of oldest sample per window
+
+        self.n   = np.zeros(nWin)
+        self.st  = np.zeros(nWin)
+        self.stt = np.zeros(nWin)
+        self.sx  = np.zeros((nWin,nChan))
+        self.stx = np.zeros((nWin,nChan))
+
+    def extend(self,rows):
+
+        '''
+        Add Block of Samples (n x channels, chronological); drop samples leaving windows
+        '''
+
+        rows = np.asarray(rows,dtype=np.float64).reshape(-1,len(self.name))
+
+        if (len(rows) == 0):
+            return
+
+        self.data.extend(rows)
+        self.count += len(rows)
+        self.since += len(rows)
+
+        if (self.since >= self.data.capacity):
+            self.rebuild()
+            return
+
+        # Entering samples --> same contribution to every window
+        t = rows[:,self.key] - self.origin
+
+        self.n   += len(rows)
+        self.st  += t.sum()
+        self.stt += t.dot(t)
+        self.sx  += rows.sum(axis=0)
+        self.stx += t.dot(rows)
+
+        # Leaving samples --> per window, oldest first
+        key  = self.data.view(self.name[self.key])
+        base = self.count - len(self.data) # Absolute index of oldest stored sample
+        stop = np.searchsorted(key,key[-1] - self.windows)
+
+        for i in range(len(self.windows)):
+
+            start = self.first[i] - base
+
+            if (start < 0):
+                self.rebuild() # Overwritten before leaving window (capacity too small)
+                return
+
+            if (stop[i] > start):
+
+                old = self.data.views()[:,start:stop[i]].T
+                t   = old[:,self.key] - self.origin
+
+                self.n[i]   -= len(old)
+                self.st[i]  -= t.sum()
+                self.stt[i] -= t.dot(t)
+                self.sx[i]  -= old.sum(axis=0)
+                self.stx[i] -= t.dot(old)
+
+                self.first[i] = base + stop[i]
+
+    def rebuild(self):
+
+        '''
+        Recompute Sums From Stored Samples, Time Origin at Newest Sample
+        '''
+
+        rows = self.data.views().T
+        key  = rows[:,self.key]
+        base = self.count - len(rows)
+
+        self.origin = key[-1]
+        self.since  = 0
+
+        for i in range(len(self.windows)):
+
+            start = np.searchsorted(key,key[-1] - self.windows[i])
+            win   = rows[start:]
+            t     = win[:,self.key] - self.origin
+
+            self.first[i] = base + start
+            self.n[i]     = len(win)
+            self.st[i]    = t.sum()
+            self.stt[i]   = t.dot(t)
+            self.sx[i]    = win.sum(axis=0)
+            self.stx[i]   = t.dot(win)
+
+    def extrap(self,name,tq,window=None):
+
+        '''
+        Fitted Line Over Lookback Window, Evaluated tq Past Newest Sample
+         - window: lookback (key channel units); must be one of windows, default tq
+        '''
+
+        if (window is None):
+            window = tq
+
+        i = int(np.flatnonzero(self.windows == window)[0])
+        j = self.name.index(name)
+        n = self.n[i]
+
+        if (len(self.data) == 0):
+            return np.nan
+
+        last = self.data.view(name)[-1]
+
+        if (n < 2):
+            return last
+
+        # Centred form: slope = cov(t,x)/var(t)
+        tMean = self.st[i]/n
+        xMean = self.sx[i,j]/n
+        var   = self.stt[i]/n - tMean**2
+
+        if (var <= 0):
+            return last
+
+        slope = (self.stx[i,j]/n - tMean*xMean)/var
+        tq    = self.data.view(self.name[self.key])[-1] - self.origin + tq
+
+        return xMean + slope*(tq - tMean)
+
+class StampParser():
+
+    '''
+    Fixed-Format Time Stamp Parser
+     - "HH:MM:SS.ffffff" --> float seconds elapsed since first stamp
+     - Caches "HH:MM:" prefix; only seconds field parsed while minute unchanged
+     - Stamps > 12 hr before first stamp treated as midnight rollover
+    '''
+
+    day  = 24*60*60
+    roll = -day/2 # Elapsed time below this --> clock wrapped past midnight
+
+    def __init__(self):
+
+        self.reset()
+
+    def reset(self):
+
+        '''
+        Forget First Stamp & Cached Prefix (new AV start)
+        '''
+
+        self.start  = None
+        self.prefix = None
+        self.base   = 0
+
+    def parse(self,stamp):
+
+        '''
+        Scalar Stamp Conversion
+        '''
+
+        prefix = stamp[0:6] # "HH:MM:"
+
+        if (prefix != self.prefix):
+
+            if (stamp[2] != ':') or (stamp[5] != ':'):
+                raise ValueError("Invalid time stamp: " + stamp)
+
+            self.base   = int(prefix[0:2])*3600 + int(prefix[3:5])*60
+            self.prefix = prefix
+
+        now = self.base + float(stamp[6:])
+
+        if (self.start is None):
+            self.start = now
+
+        elapsed = now - self.start
+
+        if (elapsed < self.roll):
+            elapsed += self.day
+
+        return elapsed
+
+    def parseArray(self,stamps):
+
+        '''
+        Vectorized Stamp Conversion (whole session)
+        '''
+
+        # Fixed-width bytes --> digit matrix; short fractions are NUL padded
+        raw = np.asarray(stamps,dtype="S15")
+
+        if (raw.size == 0):
+            return np.zeros(0)
+
+        char  = raw.view(np.uint8).reshape(raw.size,15)
+        digit = np.where(char >= 48,char.astype(np.float64) - 48,0)
+
+        if (np.any(char[:,2] != 58) or np.any(char[:,5] != 58) or np.any(char[:,8] != 46)):
+            raise ValueError("Invalid time stamp(s)")
+
+        now  = (digit[:,0]*10 + digit[:,1])*3600 + (digit[:,3]*10 + digit[:,4])*60
+        now += digit[:,6]*10 + digit[:,7]
+        now += digit[:,9:15].dot(10.0**-np.arange(1,7))
+
+        if (self.start is None):
+            self.start = float(now[0])
+
+        elapsed = now - self.start
+        elapsed[elapsed < self.roll] += self.day
+
+        return elapsed
+
+    def parseFile(self,fileName):
+
+        '''
+        Vectorized Stamp Conversion of Plain-Text Data Archive (./data/*.dat)
+        '''
+
+        stamps = []
+
+        with open(fileName,'r') as dataFile:
+            for line in dataFile:
+                if (line[0:2] == "st"): # Skip "ERROR: " lines
+                    stamps.append(line.split(',',1)[0][2:].strip())
+
+        return self.parseArray(stamps)
+
+class PacketParser():
+
+    '''
+    Vectorized Data Packet Parser
+     - "stHH:MM:SS.ffffff,ptX,pcX,..." lines --> n x channels float64 block
+     - Two-character field codes may appear in any order
+     - Fields missing from a packet hold their last value (forward fill)
+    '''
+
+    def __init__(self,name,stamp):
+
+        self.name  = list(name)
+        self.stamp = stamp # StampParser for "st" field
+        self.last  = np.full(len(self.name),np.nan) # Last value of each channel
+
+    def parseLines(self,lines):
+
+        '''
+        Batch Conversion; raises on any malformed packet
+        '''
+
+        n     = len(lines)
+        block = np.full((n,len(self.name)),np.nan)
+
+        if (n == 0):
+            return block
+
+        # Split all fields at once, track owning packet of each field
+        count = [line.count(',') + 1 for line in lines]
+        row   = np.repeat(np.arange(n),count)
+        field = np.array(','.join(lines).split(','),dtype='S')
+        width = field.dtype.itemsize
+
+        if (width <= 2):
+            raise ValueError("Empty data packet(s)")
+
+        # Fixed-width bytes --> code & value columns
+        char  = field.view(np.uint8).reshape(len(field),width)
+        code  = np.ascontiguousarray(char[:,0:2]).view("S2").ravel()
+        value = np.ascontiguousarray(char[:,2:]).view("S" + str(width - 2)).ravel()
+
+        for i in range(len(self.name)):
+
+            mask = (code == self.name[i].encode("ascii"))
+
+            if (self.name[i] == "st"):
+                block[row[mask],i] = self.stamp.parseArray(np.char.strip(value[mask]))
+            else:
+                block[row[mask],i] = value[mask].astype(np.float64)
+
+        # Forward fill missing fields from previous packet(s)
+        block = np.vstack((self.last,block))
+        valid = ~np.isnan(block)
+        index = np.where(valid,np.arange(n + 1)[:,None],0)
+        index = np.maximum.accumulate(index,axis=0)
+        block = block[index,np.arange(len(self.name))][1:]
+
+        self.last = block[-1].copy()
+
+        return block
+
+class Archive():
+
+    '''
+    Binary Columnar Session Archive (./data/*.bin)
+     - Fixed-size text header: schema (channel names, dtype) & start time(s)
+     - Append-only fixed-width records, one little-endian float64 per channel
+     - Telemetry gap (link lost): record w/ "st" of last sample before gap, all other channels NaN
+     - Archive.load --> numpy.memmap record array; archive["pt"] is a zero-copy column
+    '''
+
+    magic    = "SRTGC-ARCHIVE 1"
+    headSize = 512 # Header bytes, record data starts here
+    dtype    = "<f8"
+
+    def __init__(self,fileName,name,start,stamp=None):
+
+        self.name    = fileName   # File-like name for closeLog rename
+        self.channel = list(name)
+        self.start   = start      # Session wall clock start (ISO 8601)
+        self.stamp   = stamp      # StampParser --> AV clock of first packet
+        self.count   = 0
+
+        self.file = open(fileName,'wb')
+        self.file.write(self.header())
+
+    def header(self):
+
+        '''
+        Fixed-Size Header Bytes
+        '''
+
+        avStart = ''
+
+        if (self.stamp is not None) and (self.stamp.start is not None):
+            avStart = repr(float(self.stamp.start))
+
+        text  = self.magic + '\n'
+        text += "channels " + ','.join(self.channel) + '\n'
+        text += "dtype "    + self.dtype + '\n'
+        text += "start "    + self.start + '\n'
+        text += "avStart "  + avStart + '\n' # Seconds of day of first "st" stamp
+        text += "count "    + str(self.count) + '\n'
+
+        head = text.encode("ascii")
+
+        if (len(head) >= self.headSize):
+            raise ValueError("Archive header too long")
+
+        return head + b' '*(self.headSize - len(head) - 1) + b'\n'
+
+    def write(self,rows):
+
+        '''
+        Append Block of Records (n x channels)
+        '''
+
+        rows = np.ascontiguousarray(rows,dtype=self.dtype).reshape(-1,len(self.channel))
+
+        self.file.write(rows.tobytes())
+        self.count += len(rows)
+
+    def flush(self):
+
+        self.file.flush()
+
+    def fileno(self):
+
+        return self.file.fileno()
+
+    def close(self):
+
+        '''
+        Finalize Header & Close
+        '''
+
+        if (self.file.closed):
+            return
+
+        self.file.seek(0)
+        self.file.write(self.header())
+        self.file.close()
+
+    @staticmethod
+    def load(fileName):
+
+        '''
+        Open Archive Read-Only w/o Copying --> (record memmap, header dict)
+        '''
+
+        with open(fileName,'rb') as archFile:
+            text = archFile.read(Archive.headSize).decode("ascii").rstrip().split('\n')
+
+        if (text[0] != Archive.magic):
+            raise ValueError("Not a session archive: " + fileName)
+
+        head = {}
+
+        for line in text[1:]:
+            field = line.split(' ',1)
+            head[field[0]] = field[1] if (len(field) > 1) else ''
+
+        dtype = np.dtype([(name,head["dtype"]) for name in head["channels"].split(',')])
+        count = (os.path.getsize(fileName) - Archive.headSize)//dtype.itemsize # Live file: whole records only
+
+        if (count == 0):
+            return np.zeros(0,dtype=dtype),head
+
+        data = np.memmap(fileName,dtype=dtype,mode='r',offset=Archive.headSize,shape=(count,))
+
+        return data,head
@@ -30,45 +30,48 @@ Input(s):
 Output(s):
     ./log/*.log    plain-text command log
     ./dat/*.dat    plain-text data archive
+    ./dat/*.bin    binary columnar data archive
 '''
 
+# Startup timing reference --> taken before any heavy import
+import time
+bootTime = time.perf_counter()
+
 # Installed modules --> Utilities
 import sys
 import os
-import serial, serial.tools.list_ports
-from serial.serialutil import SerialException
-import time
 from datetime import datetime
 import numpy as np 
 
 # Installed modules --> PyQt related
 from PyQt5 import (QtGui, QtCore, QtSvg)
-from PyQt5.QtCore import (Qt, QThread, pyqtSignal, QDate, QTime, QDateTime, QSize)
+from PyQt5.QtCore import (Qt, QThread, QTimer, pyqtSignal, QDate, QTime, QDateTime, QSize)
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QDesktopWidget, QPushButton, QApplication, QGroupBox, QGridLayout, QStatusBar, QFrame, QTabWidget,QComboBox)
-import pyqtgraph as pg
 
 # Program modules
 from srt_gc_launchState  import State
-from srt_gc_launchThread import SerThread, UptimeThread
-from srt_gc_launchTools  import Tools, Object
+from srt_gc_launchThread import UptimeThread, WriterThread
+from srt_gc_launchTools  import Tools, Object, Histogram
 from srt_gc_launchStyle  import Style, Color
 from srt_gc_launchConstr import Constr
-
-# used to monitor wifi networks.
-import subprocess
+from srt_gc_launchData   import RingBuffer, TierBuffer, Trend, StampParser, PacketParser, Archive
+from srt_gc_launchReplay import Replay
+from srt_gc_launchLink   import LinkThread, TcpLink, SerialLink, PollLink
+from srt_gc_launchN2O    import SatTable, Tank
+from srt_gc_launchConsole import Console, LineRing
+from srt_gc_launchScan   import ScanThread
 
 # used to get date and time in clock method.
 import datetime as dt
 
-# used to connect to ethernet socket in connect method.
-import socket
-
 # data for ethernet connection to SRT6 router
-# Create a TCP/IP socket for srt router
-sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+# TcpLink opens a fresh socket per connection
 TCP_IP = '192.168.1.177'
 TCP_PORT = 23
 server_address = (TCP_IP, TCP_PORT)
+sim_address    = ('127.0.0.1', 2323) # srt_gc_launchSim.py default
+
+importTime = time.perf_counter() # All modules loaded
 
 class Gui(QMainWindow):
     
@@ -97,8 +100,17 @@ class Gui(QMainWindow):
         self.led    = Object() # LED indicator container
         self.ledClr = Object() # LED pixmap container
         self.sensor = Object() # Sensor readout container
-        self.data   = Object() # Data array container
-        self.plot   = Object() # Plot container
+        self.plot   = []       # Plot container; empty until plot tab first shown
+
+        # Startup timing [sec]: modules, window layout, first paint, lazy tab builds
+        self.boot        = Object()
+        self.boot.start  = time.perf_counter()
+        self.boot.paint  = None
+        self.boot.tab    = {}
+        self.boot.text   = ""
+        self.threadsUp   = False # Writer, link & uptime threads started
+
+        self.lazy = {} # Tab widget --> builder, run on first show
 
         ledImg = ["green","yellow","red","off"] # LED indicator image files
 
@@ -214,9 +226,15 @@ class Gui(QMainWindow):
         self.sessInit()    # Session toolbar 
         self.btnCtrlInit() # Buttons for control panel 
         self.ledCtrlInit() # LED inidicators " "
-        self.plotInit()    # Engine diagnostics, plots
         self.dataInit()    # Engine diagnostics, readouts
         self.outInit()     # Raw serial output
+        self.renderInit()  # Plot & readout redraw timer
+        self.diagInit()    # Packet latency diagnostics
+
+        # Heavy tabs (pyqtgraph plots, serial console) built on first show
+        self.lazy[self.groupPlot] = self.plotInit
+        self.lazy[self.groupOut]  = self.outBuild
+        self.tabData.currentChanged.connect(self.tabBuild)
         
         # Row & column stretching in master grid
         rowStr = [1, 4, 8]
@@ -246,6 +264,72 @@ class Gui(QMainWindow):
         # Final initialization
         self.show()
 
+        # First paint of central widget --> bootFinish
+        self.boot.layout = time.perf_counter()
+        mainWidget.installEventFilter(self)
+
+    def eventFilter(self,obj,event):
+
+        '''
+        First Paint Detection (startup timing)
+        '''
+
+        if (event.type() == QtCore.QEvent.Paint) and (self.boot.paint is None):
+            self.boot.paint = time.perf_counter()
+            obj.removeEventFilter(self)
+            QTimer.singleShot(0,self.bootFinish) # After paint completes
+
+        return False
+
+    def bootFinish(self):
+
+        '''
+        Post-Paint Startup: visible lazy tab, worker threads, startup timing report
+        '''
+
+        self.tabBuild(self.tabData.currentIndex())
+        self.threadStart()
+
+        # Startup report [ms]: import, layout, first paint, lazy tab(s)
+        text = ["import %.0f" % (1e3*(importTime - bootTime)),
+                "layout %.0f" % (1e3*(self.boot.layout - self.boot.start)),
+                "paint %.0f" % (1e3*(self.boot.paint - bootTime))]
+
+        for name in self.boot.tab:
+            text.append(name + " %.0f" % (1e3*self.boot.tab[name]))
+
+        self.boot.text = ', '.join(text)
+        self.logEvent("STARTUP",self.boot.text)
+
+    def tabBuild(self,index):
+
+        '''
+        Build Tab Contents on First Show
+        '''
+
+        group   = self.tabData.widget(index)
+        builder = self.lazy.pop(group,None)
+
+        if (builder is not None):
+
+            t0 = time.perf_counter()
+            builder()
+            self.boot.tab[self.tabData.tabText(index)] = time.perf_counter() - t0
+
+    def threadStart(self):
+
+        '''
+        Start Worker Threads (once); deferred until window painted
+        '''
+
+        if (not self.threadsUp):
+
+            self.threadsUp = True
+            self.uptimeThread.start()
+            self.writer.start()
+            self.linkThread.start()
+            self.scanThread.start()
+
     def titleInit(self): 
 
         '''
@@ -307,8 +391,7 @@ class Gui(QMainWindow):
         self.statusBar.uptime = self.constr.readout(gridStatus,"statusBar",[0,9,1,1])
 
         # Uptime thread management
-        self.uptimeThread = UptimeThread(self.startGlobal,self.statusBar.uptime)
-        self.uptimeThread.start()
+        self.uptimeThread = UptimeThread(self.startGlobal,self.statusBar.uptime) # Started w/ threadStart
 
         # Row & column stretching in comm grid
         rowStr = [] 
@@ -326,6 +409,41 @@ class Gui(QMainWindow):
         self.state.connected = False
         self.state.reading   = False
 
+        # Serial line batching --> GUI thread handles lists of lines, not single lines
+        self.batchTime = 0.05 # Max. time lines held in serial thread (sec)
+        self.batchSize = 100  # Max. no. lines per batch
+
+        # Connection timeouts
+        self.connTime  = 5.0        # Max. time to open port/socket (sec)
+        self.handTime  = 1.0        # Max. wait for first data after handshake/bypass (sec)
+        self.retryTime = [0.1, 5.0] # Reconnect delay after link lost: first, max. (sec)
+
+        # Control commands: min. gap between sends (sec), max. wait for echo (sec), resends
+        self.commTime    = [0.1, 1.0]
+        self.commRetries = 2
+
+        # Transport links (TCP, serial, replay) --> one event loop thread
+        self.linkName   = None # Port of open (or opening) link
+        self.linkLost   = None # Time link lost (time.perf_counter), None while up
+        self.linkMember = []   # Member names when linkName is a redundant group ("Dual")
+        self.linkThread = LinkThread(self.batchTime,self.batchSize,self.connTime,self.handTime,self.retryTime,
+                                     commTime=self.commTime,retries=self.commRetries)
+
+        self.linkThread.outSig.connect(self.outUpdate)
+        self.linkThread.stateSig.connect(self.stateUpdate)
+        self.linkThread.dataSig.connect(self.dataUpdate)
+        self.linkThread.phaseSig.connect(self.linkPhase)
+        self.linkThread.discSig.connect(self.linkDisc)
+        self.linkThread.errSig.connect(self.linkErr)
+        self.linkThread.commSig.connect(self.commEvent)
+
+        # Port & network discovery --> portMenu updated as sources finish, hot-plug polled
+        self.scanThread = ScanThread("./data/",[server_address,sim_address])
+
+        self.scanThread.foundSig.connect(self.portFound)
+        self.scanThread.lostSig.connect(self.portLost)
+        self.scanThread.doneSig.connect(self.portDone)
+
         if (os.name == "posix"):
             prefix = "/dev/tty"
         elif (os.name == "nt"):
@@ -376,6 +494,10 @@ class Gui(QMainWindow):
 
     def sessInit(self):
 
+        # Background file writer --> log, data & archive writes off GUI thread
+        self.writer = WriterThread()
+        self.writer.reportSig.connect(self.writeReport)
+
         # Session name
         self.led.sess       = self.constr.led(self.gridSess,[0,0,1,1])
         self.btn.sessNew    = self.constr.button(self.gridSess,"NEW","btnClkSessNew",self.color.comm,[0,1,1,1])
@@ -405,31 +527,46 @@ class Gui(QMainWindow):
         self.tools.resize(self.gridSess,rowStr,colStr)
 
     def btnClkSearch(self):
-        # set the port menu to be cleared initially.
-        self.portMenu.clear()
 
-        # check the number of serial ports available.
-        ports = serial.tools.list_ports.comports()
+        '''
+        "SEARCH" Button Event Handling --> background rescan incl. Wi-Fi & TCP; menu kept, changes applied
+        '''
 
-        # if ports exist, add it to drop down menu in GUI
-        if (ports):
-            for port in ports:
-                entry = "Serial: " + port.device + " - " + port.description
-                self.portMenu.addItem(entry)
-        
-        # uses subprocess package to check for connected wifi networks.
-        devices = subprocess.check_output(['netsh','wlan','show','network']).decode('ascii').replace("\r","")
-        numOfWifiDevices = len(devices.split("SSID"))
-        
-        #  check to see the number of wifi networks we can connect to 
-        if numOfWifiDevices:
-            for deviceNum in range(1, numOfWifiDevices):
-                entry = "Wifi Network: " + devices.split("SSID")[deviceNum].split(" ")[3]
-                self.portMenu.addItem(entry)
+        self.scanThread.scan()
+        self.logEvent("SEARCH","SCANNING")
+
+    def portFound(self,key,entry):
 
+        # New or changed entry; scan key stored as item data
+        index = self.portMenu.findData(key)
+
+        if (index < 0):
+            self.portMenu.addItem(entry,key)
         else:
+            self.portMenu.setItemText(index,entry)
+
+        # Serial port --> also offered paired w/ router link
+        if (key.startswith("serial:")):
+            self.portFound("dual:" + key[7:],"Dual " + key[7:] + " - XBee + Wifi")
+
+    def portLost(self,key):
+
+        # Unplugged port, deleted file, network out of range
+        index = self.portMenu.findData(key)
+
+        if (index >= 0):
+            self.portMenu.removeItem(index)
+
+        if (key.startswith("serial:")):
+            self.portLost("dual:" + key[7:])
+
+    def portDone(self,count):
+
+        if (count == 0):
             self.portMenu.setCurrentText("NO DEVICE(S) FOUND")
 
+        self.logEvent("SEARCH",str(count) + " FOUND")
+
     def btnClkClock(self):
         '''
         "CLOCK" Button Event Handling 
@@ -462,7 +599,7 @@ class Gui(QMainWindow):
         # sudo date -s 'YYYY-MM-DD HH:MM:SS'
         #os.system('cmdStr' + ' ' + '\'' + dateStr + ' ' + timeStr + '\'')
 
-        self.led.clock.setPixmap(self.ledClr.yellow)
+        self.state.paint("clock","yellow")
 
 
     def btnClkConn(self):
@@ -471,90 +608,197 @@ class Gui(QMainWindow):
         "CONNECT" Button Event Handling. Attempts to connect to SRT Router and Serial
         '''
 
-        if (self.state.connected):
+        self.threadStart() # No-op once started
+
+        if (self.state.connected) or (self.linkName is not None):
             self.logEvent("ERROR","ALREADY CONNECTED")
         else: 
 
-            # User input --> Port name & baud rate
+            # User input --> Port name & baud rate; replay path may hold spaces --> split once
             text      = str(self.portMenu.currentText())
-            text      = text.split(' ')
+            text      = text.split(' ',1)
             self.port = text[0]
             self.baud = int(str(self.baudMenu.currentText()))
+            field     = text[1].split(' ') if (len(text) > 1) else []
+            links     = None
+            address   = None
 
             if (self.port == "/dev/tty"):
                 self.logEvent("ERROR","INVALID PORT")
             else:
-                if (self.port == "Wifi"):
-                    try:
-                        # Attempt to connect to router/ethernet over ubiquity
-                        sock.connect(server_address)
-                        self.ser = sock
-
-                        # Set connected Status true, change LED, log connected status if connected to Ethernet
-                        self.state.connected = True
-                        self.logEvent("CONNECTED",self.port)                    
-                        self.led.commConn.setPixmap(self.ledClr.yellow)
-
-                        # must send a command initially for it to stay connected and read data over ethernet.
-                        missionCMD = 'b'
-                        missionCMD = bytes(missionCMD, 'utf-8')
-                        sock.sendall(missionCMD)
-
-                        # Thread handling
-                        self.serThread  = SerThread(self.ser)
-
-                        self.serThread.outSig.connect(self.outUpdate)
-                        self.serThread.stateSig.connect(self.stateUpdate)
-                        self.serThread.dataSig.connect(self.dataUpdate)
-                        self.serThread.resetSig.connect(self.readFail)
-                        
-                        # Test for bypass condition
-                        text = self.ser.recv(100)
-                        if (len(text) > 0):
-
-                            # Check for empty packet
-                            self.state.reading = True
-                            self.logEvent("READING",self.port)
-                            self.led.commByp.setPixmap(self.ledClr.yellow)
-
-                            self.serThread.start()
-                    except (TimeoutError, OSError):
-                        self.logEvent("ERROR","INVALID PORT") 
+                try:
+                    if (self.port == "Replay"):
+
+                        # Recorded session stands in for port: "Replay <file> [speed]"
+                        path,speed = self.replaySpec(text[1])
+                        link       = PollLink(self.port,Replay(path,speed))
+
+                    elif (self.port == "Wifi"):
+
+                        # Optional endpoint override, e.g. "Wifi 127.0.0.1:2323" (srt_gc_launchSim.py)
+                        address = self.endpoint(field[0:1])
+
+                        # Router/ethernet over ubiquity
+                        link = TcpLink(self.port,address[0],address[1])
+
+                    elif (self.port == "Dual"):
+
+                        # XBee & router read together, e.g. "Dual /dev/ttyUSB0 [127.0.0.1:2323]"
+                        address = self.endpoint(field[1:2])
+                        links   = [SerialLink("XBee",field[0],self.baud),
+                                   TcpLink("Wifi",address[0],address[1])]
+
+                    else:
+
+                        # XBee serial port
+                        link = SerialLink(self.port,self.port,self.baud)
+
+                except (IndexError,ValueError,OSError):
+                    self.logEvent("ERROR","INVALID PORT")
+                    return
+
+                # Connects in background --> linkPhase, linkErr on failure
+                self.linkName = self.port
+
+                # Endpoint in use skipped by SEARCH (probe would open 2nd router connection)
+                self.scanThread.hold([address] if (address is not None) else [])
+
+                if (links is None):
+                    self.linkMember = []
+                    self.linkThread.add(link)
                 else:
-                    try:
-                        # Attempt to connect to serial
-                        self.ser = serial.Serial(self.port,self.baud,timeout=1)
-                        self.state.connected = True
-                        self.logEvent("CONNECTED",self.port)                    
-                        self.led.commConn.setPixmap(self.ledClr.yellow)
-
-                        # trying to send a command initially to see if that makes it easy to get connected.
-                        missionCMD = 'b'
-                        missionCMD = bytes(missionCMD, 'utf-8')
-                        self.ser.write(missionCMD)
-                
-                        # Thread handling
-                        self.serThread  = SerThread(self.ser)
+                    self.linkMember = [link.name for link in links]
+                    self.linkThread.addGroup(self.port,links)
 
-                        self.serThread.outSig.connect(self.outUpdate)
-                        self.serThread.stateSig.connect(self.stateUpdate)
-                        self.serThread.dataSig.connect(self.dataUpdate)
-                        self.serThread.resetSig.connect(self.readFail)
+    def endpoint(self,text):
 
-                        # Test for bypass condition
-                        text = self.ser.readline()
+        '''
+        Optional "<host>:<port>" Field --> TCP address (default: router)
+        '''
 
-                        if (len(text) > 0):
+        if (text):
+            field = text[0].rsplit(':',1)
+            if (len(field) == 2) and (field[1].isdigit()):
+                return (field[0],int(field[1]))
 
-                            # Check for empty packet
-                            self.state.reading = True
-                            self.logEvent("READING",self.port)
-                            self.led.commByp.setPixmap(self.ledClr.yellow)
-    
-                            self.serThread.start()
-                    except:
-                        self.logEvent("ERROR","INVALID PORT") 
-               
+        return server_address
+
+    def replaySpec(self,text):
+
+        '''
+        "<file> [speed]" --> (file, speed); file may contain spaces
+        '''
+
+        field = text.rsplit(' ',1)
+
+        if (len(field) == 2):
+            try:
+                return field[0],float(field[1])
+            except ValueError:
+                pass
+
+        return text,1
+
+    def linkPhase(self,name,phase):
+
+        '''
+        Link Phase Change --> connection LEDs & log
+         - connecting --> handshaking (port open, hello sent) --> bypass (optional) --> reading (first lines)
+         - reconnecting: link lost, next attempt after backoff; session files stay open
+         - failed: never connected, or lost w/o reconnect --> reset (linkErr already logged cause)
+         - Redundant group: group phase drives LEDs; member reading & failures only logged
+        '''
+
+        if (name in self.linkMember):
+
+            if (phase in ["reading","failed"]):
+                self.logEvent("LINK " + phase.upper(),name)
+
+            return
+
+        if (name != self.linkName):
+            return
+
+        if (phase == "connecting"):
+            self.logEvent("CONNECTING",name)
+
+        elif (phase == "reconnecting"):
+            self.logEvent("RECONNECTING",name)
+
+        elif (phase == "failed"):
+
+            if (self.state.connected) or (self.linkLost is not None):
+                self.btnClkRes()
+            else:
+                self.linkName = None # Port free for next attempt
+                self.scanThread.hold([])
+
+        elif (phase == "handshaking") and (not self.state.connected):
+
+            # Set connected Status true, change LED, log connected status
+            self.state.connected = True
+            self.logEvent("CONNECTED",name)
+            self.state.paint("commConn","yellow")
+
+        elif (phase == "bypass"):
+            self.logEvent("BYPASS",name)
+
+        elif (phase == "reading"):
+
+            self.state.reading = True
+            self.logEvent("READING",name)
+            self.state.paint("commByp","yellow")
+
+            if (self.linkLost is not None):
+                self.logEvent("RECONNECTED",name + " gap %.2f s" % (time.perf_counter() - self.linkLost))
+                self.linkLost = None
+
+    def linkDisc(self,name,reason):
+
+        '''
+        Link Closed by Peer or Failed --> Mark Gap; linkPhase reports reconnect or failure
+        '''
+
+        # Redundant group member --> stream continues on other member(s)
+        if (name in self.linkMember):
+            self.logEvent("LINK DOWN",name + ' ' + reason)
+            return
+
+        # Closed by RESET --> already handled
+        if (name != self.linkName):
+            return
+
+        self.state.connected = False
+        self.state.reading   = False
+        self.state.paint("commConn","red")
+        self.state.paint("commByp","off")
+
+        self.logEvent("LINK LOST",name + ' ' + reason)
+
+        if (self.linkLost is None):
+            self.linkLost = time.perf_counter()
+            self.gapMark()
+
+    def gapMark(self):
+
+        '''
+        Archive Gap Record: last "st" before gap, other channels NaN
+        '''
+
+        if (self.state.log) and (len(self.data) > 0):
+
+            row = np.full((1,len(self.dataName)),np.nan)
+            row[0,self.dataName.index("st")] = self.data.st[-1]
+
+            self.writer.put(self.archFile,row)
+
+    def linkErr(self,name,text):
+
+        '''
+        Link Error (connect, read or write)
+        '''
+
+        self.logEvent("ERROR",name + ' ' + text)
 
     def btnClkByp(self):
         # haven't updated bypass method for ubiquity, just Xbee
@@ -569,21 +813,8 @@ class Gui(QMainWindow):
         else:
 
             # enter, enter, (wait), 'b' --> bypass XBee dongle w/ ascii encoding 
-            self.ser.write(b'\r\n\r\n')
-            time.sleep(2)
-            self.ser.write(b'b\r\n')
-
-            # Test for bypass condition
-            text = self.ser.readline()
-
-            if (len(text) > 0):
-
-                # Check for empty packet
-                self.state.reading = True
-                self.logEvent("READING",self.port)
-                self.led.commByp.setPixmap(self.ledClr.yellow)
-
-                self.serThread.start()
+            # Sequence runs on link thread; first packet after bypass --> linkPhase
+            self.linkThread.bypass(self.linkName)
             
     def btnClkRes(self):
 
@@ -591,17 +822,24 @@ class Gui(QMainWindow):
         "RESET" Button Event Handling
         '''
 
-        if (self.state.connected):
+        if (self.state.connected) or (self.linkName is not None):
+
+            # Link statistics dropped w/ link --> log first
+            self.linkStats()
+
+            # Link closed on event loop; its discSig ignored once linkName cleared
+            self.linkThread.remove(self.linkName)
+            self.linkName   = None
+            self.linkMember = []
+            self.linkLost   = None
+            self.scanThread.hold([])
 
-            # This is discouraged but thread.quit() and thread.exit() don't work [brute force method]
-            self.serThread.terminate()
             self.state.reading = False
-            self.led.commByp.setPixmap(self.ledClr.off)
+            self.state.paint("commByp","off")
 
-            self.ser.close()
             self.state.connected = False 
             self.logEvent("DISCONNECTED",self.port)
-            self.led.commConn.setPixmap(self.ledClr.off)
+            self.state.paint("commConn","off")
 
             # Reset all control status LEDs
             ledName = list(self.led.__dict__)
@@ -610,7 +848,7 @@ class Gui(QMainWindow):
                 if (name == "sess"): # Don't reset session LED
                     continue
                 else:
-                    getattr(self.led,name).setPixmap(self.ledClr.off)
+                    self.state.paint(name,"off") # Next frame; LEDs already off skipped
 
         else:
             self.logEvent("ERROR","NO CONNECTION")
@@ -680,8 +918,9 @@ class Gui(QMainWindow):
             
             # Construct button 
             btn      = self.constr.button(grid,text,method,color,[row,col,rSpan,cSpan])
+            btn.name = name
             btn.comm = self.state.btnMap(name) # Find & set character command
-            btn.led  = [] # Create empty list of associated LEDs
+            btn.led  = [] # Create empty list of associated LED names
 
             # Assign to container
             setattr(self.btn,name,btn)
@@ -697,24 +936,32 @@ class Gui(QMainWindow):
         self.logEvent(sender.text(),sender.comm)   
 
         # Trigger red LED state
-        if (self.state.connected):
-            for led in sender.led:
-                led.setPixmap(self.ledClr.red)
+        if (self.linkName is not None):
+            for name in sender.led:
+                self.state.paint(name,"red")
 
-        try:
+        # Queued on link thread, even while reconnecting (resent until echoed); safety commands first
+        if (self.linkName is not None):
+            self.linkThread.command(self.linkName,sender.name,sender.comm.encode("ascii"))
+        else:
+            self.logEvent("ERROR","NO CONNECTION")
 
-            comm = sender.comm.encode("ascii")
-            try:
-                self.ser.sendall(comm)
-            except:
-                self.ser.write(comm)
+    def commEvent(self,name,event,latency,tries):
 
-        except: 
+        '''
+        Command Progress --> ack latency; resend, timeout & drop logged
+        '''
 
-            if (self.state.connected):
-                self.logEvent("ERROR","WRITE FAIL")
-            else:
-                self.logEvent("ERROR","NO CONNECTION")
+        if (event == "ACK"):
+            self.latency.hist["ack"].add(latency)
+        elif (event == "RETRY"):
+            self.logEvent("RETRY",name + " try " + str(tries))
+        elif (event == "TIMEOUT"):
+            self.logEvent("ERROR","NO ACK " + name)
+        elif (event == "DROPPED"):
+            self.logEvent("DROPPED",name)
+        elif (event == "SUPERSEDED"):
+            self.logEvent("SUPERSEDED",name)
 
     def btnClkSessRename(self):
 
@@ -727,6 +974,8 @@ class Gui(QMainWindow):
             self.logEvent("ERROR","FILE IO")
 
     def btnClkSessNew(self):
+
+        self.threadStart() # Writer must run before any file is released
         
         try: 
 
@@ -758,8 +1007,12 @@ class Gui(QMainWindow):
 
                 setattr(self,fileObj[i],open(fileDir[i] + fileName,'w'))
 
+            # Binary columnar archive alongside plain-text data file
+            fileName      = self.dataFile.name[:-len(".dat")] + ".bin"
+            self.archFile = Archive(fileName,self.dataName,dateStr + 'T' + startStr,self.stamp)
+
             self.state.log = True
-            self.led.sess.setPixmap(self.ledClr.yellow)
+            self.state.paint("sess","yellow")
 
         except:
             self.logEvent("ERROR","FILE IO")
@@ -813,7 +1066,7 @@ class Gui(QMainWindow):
 
             # Attach LEDs to associated buttons
             for btnName in btn:
-                getattr(self.btn,btnName).led.append(led)
+                getattr(self.btn,btnName).led.append(name)
 
             # Assign to container
             setattr(self.led,name,led)
@@ -827,13 +1080,18 @@ class Gui(QMainWindow):
         # Data storage initialization
         # time stamp, run tank press, chamber press, run tank temp, chamber temp, aux temp
         self.dataTime = 1*60 # Data array length (sec)
+        self.dataRate = 50   # Max. packet rate (Hz), sizes ring buffer
         self.dataName = ["st","pt","pc","tt","tc","ta"]
-        self.dataDict = {}
+        self.trendTime = [30, 1*60, 5*60] # Extrapolation readout horizons (sec); lookback = horizon
 
-        for name in self.dataName:
-            # looks like it sets dataDict[st], dataDict[pt], ... and so on to none in initialization
-            setattr(self.data,name,np.array([]))
-            self.dataDict[name] = None
+        self.dataAlloc()
+
+        # Run tank load estimate --> saturated N2O table lookups per data batch
+        self.tankVol    = 0.5 # Run tank internal volume [ft³]
+        self.tankUllage = 0.1 # Ullage w/ liquid at run vent dip tube (fraction)
+
+        self.sat  = SatTable()
+        self.tank = Tank(self.sat,self.tankVol,self.tankUllage)
 
         # Sensor readout specification
         # name, text, unit, code, row, col, row span, col span
@@ -844,12 +1102,14 @@ class Gui(QMainWindow):
                       (  "pRun1m",    "Extrap\n1 min", "[ psi ]", "pt", 1*60, 2, 2, 1, 1),
                       (  "pRun5m",    "Extrap\n5 min", "[ psi ]", "pt", 5*60, 3, 2, 1, 1),
                       (  "pChamb",     "Press\nChamb", "[ psi ]", "pc",    0, 4, 2, 1, 1),
+                      (   "mTank",      "Mass\nTank",  "[ lb ]", "mass",    0, 5, 2, 1, 1),
         # Temperature column
                       (    "tRun",        "Temp\nRun",  "[ °F ]", "tt",    0, 0, 6, 1, 1),
                       ( "tRun30s",   "Extrap\n30 sec",  "[ °F ]", "tt",   30, 1, 6, 1, 1),
                       (  "tRun1m",    "Extrap\n1 min",  "[ °F ]", "tt", 1*60, 2, 6, 1, 1),
                       (  "tRun5m",    "Extrap\n5 min",  "[ °F ]", "tt", 5*60, 3, 6, 1, 1),
-                      ( "pRunVap",     "Press\nVapor", "[ psi ]", "tt",    0, 4, 6, 1, 1)]
+                      ( "pRunVap",     "Press\nVapor", "[ psi ]", "tt",    0, 4, 6, 1, 1),
+                      (   "uTank",    "Ullage\nTank",   "[ % ]", "ullage",  0, 5, 6, 1, 1)]
 
         for spec in sensorSpec:
 
@@ -868,6 +1128,7 @@ class Gui(QMainWindow):
             sensor        = self.constr.readout(self.gridPlot,"sensor",[row,col,rSpan,cSpan])
             sensor.code   = code   # Data code
             sensor.extrap = extrap # Forward extrapolation time
+            sensor.shown  = "-"    # Displayed text; unchanged text not redrawn
 
             # Assign to container
             setattr(self.sensor,name,sensor)
@@ -885,6 +1146,35 @@ class Gui(QMainWindow):
 
         self.tools.resize(self.gridPlot,rowStr,colStr)
 
+    def dataAlloc(self):
+
+        '''
+        Data Storage & Parser Allocation (from dataName, dataTime, dataRate)
+        '''
+
+        # Data array container; self.data.<code> --> chronological view
+        self.data = RingBuffer(self.dataName,self.dataTime*self.dataRate,window=self.dataTime,key="st")
+
+        # History tiers --> downsampled (mean/min/max) history beyond dataTime
+        # bin width (sec), span (sec)
+        tierSpec = [(0.1, 10*60),     # 10 min
+                    (  1, 12*60*60)]  # Session (up to 12 hr)
+
+        self.tier = []
+
+        for spec in tierSpec:
+            self.tier.append(TierBuffer(self.dataName,spec[0],spec[1],key="st"))
+
+        # Least-squares trend per extrapolation horizon --> running sums, O(1) per packet
+        # 2x capacity --> samples leave longest window before being overwritten
+        self.trend = Trend(self.dataName,2*max(self.trendTime)*self.dataRate,self.trendTime,key="st")
+
+        # "st" field parser --> elapsed sec from AV start (first packet)
+        self.stamp = StampParser()
+
+        # Data packet parser --> maps codes to readings, whole batch at once
+        self.parser = PacketParser(self.dataName,self.stamp)
+
     def plotInit(self): 
 
             '''
@@ -900,8 +1190,9 @@ class Gui(QMainWindow):
             hour = [1,2,3,4,5,6,7,8,9,10]
             temperature = [400,432,434,432,433,431,429,432,435,445]
 
-            self.plot[0]   = self.constr.plot(self.gridPlot,yRange,xLabel,yLabel,[0,0,5,1])
+            self.plot[0]   = self.constr.plot(self.gridPlot,yRange,xLabel,yLabel,[0,0,6,1])
             self.plotPress = self.plot[0].plot()
+            self.plotVap   = self.plot[0].plot() # N2O vapor pressure from run tank temp
             
             # Temperature plot 
             yRange = [0,150]
@@ -910,151 +1201,464 @@ class Gui(QMainWindow):
             hour = [1,2,3,4,5,6,7,8,9,10]
             temperature = [100,90,80,90,90,90,100,100,100,100]
 
-            self.plot[1]  = self.constr.plot(self.gridPlot,yRange,xLabel,yLabel,[0,4,5,1])
+            self.plot[1]  = self.constr.plot(self.gridPlot,yRange,xLabel,yLabel,[0,4,6,1])
             self.plotTemp = self.plot[1].plot()
 
+            self.dirty = True # Draw data stored before plots existed
+
     def outInit(self):
 
-        # Create scroll box for raw serial output 
-        self.serialOut = self.constr.scrollBox(self.gridOut,[0,0,1,1])
+        # Raw serial output --> held in ring until console first shown
+        self.outCap    = 10000 # Max. lines kept per filter
+        self.outPend   = LineRing(self.outCap)
+        self.serialOut = None
+
+    def outBuild(self):
+
+        # Console controls: pause (scroll lock), line filter
+        self.btn.outPause = self.constr.button(self.gridOut,"PAUSE","btnClkOutPause",self.color.comm,[0,0,1,1])
+        self.labOutFilter = self.constr.label(self.gridOut,"label","Show","Center",[0,1,1,1])
+        self.outFilter    = self.constr.dropDown(self.gridOut,[0,2,1,1])
+
+        self.outFilter.setEditable(False)
+        self.outFilter.addItems(Console.filterName)
+        self.outFilter.currentTextChanged.connect(self.outFilterSet)
+
+        # Raw serial output --> bounded line console (oldest lines dropped)
+        self.serialOut = self.constr.console(self.gridOut,[1,0,1,4],self.outCap)
+        self.serialOut.add(self.outPend.snapshot())
+        self.outPend   = None
+
+        # Row & column stretching in out grid
+        rowStr = [0, 1]
+        colStr = [1, 1, 1, 6]
 
-    def outUpdate(self,text):
+        self.tools.resize(self.gridOut,rowStr,colStr)
 
-        self.serialOut.moveCursor(QtGui.QTextCursor.End)
-        self.serialOut.insertPlainText(text + "\n")
-        sb = self.serialOut.verticalScrollBar()
-        sb.setValue(sb.maximum())
+    def outUpdate(self,lines):
 
-    def stateUpdate(self,text):
+        if (self.serialOut is None):
+            self.outPend.extend(lines)
+        else:
+            self.serialOut.add(lines)
+
+    def btnClkOutPause(self):
+
+        '''
+        "PAUSE" Button Event Handling --> freeze console for reading; lines still kept
+        '''
+
+        paused = not self.serialOut.paused
+
+        self.serialOut.setPaused(paused)
+        self.btn.outPause.setText("RESUME" if (paused) else "PAUSE")
+
+    def outFilterSet(self,name):
+
+        self.serialOut.setFilter(name)
+
+    def stateUpdate(self,lines):
         '''
         Control State Update
         '''
 
-        # Update statusbar
-        self.statusBar.recieved.setText(text)
+        for text in lines:
 
+            # Update statusbar
+            self.statusBar.recieved.setText(text)
+
+            try:
+
+                # Logs state event, update state object, update PID graphic (eventually)
+                self.logEvent("STATE",text)
+
+                # QUICK FIX FOR ABORT STATE 
+                if (text == "xLBabo"):
+                    self.state.update("xLBrl10")
+                    self.state.update("xLBrl20")
+                else:
+                    self.state.update(text)
+
+            except:
+                self.logEvent("ERROR","STATE FAIL")
+
+    def dataUpdate(self,lines,readTime=None,emitTime=None): 
+
+        '''
+        Data Packet Ingest (drawing deferred to renderUpdate)
+         - readTime, emitTime: LinkThread time stamps (time.perf_counter) for latency stats
+        '''
+
+        dispTime = time.perf_counter()
+
+        # Write to data log
+        if self.state.log:
+            self.writer.put(self.dataFile,'\n'.join(lines) + '\n')
+
+        # Process data packets --> whole batch, else packet by packet to isolate failures
         try:
+            block = self.parser.parseLines(lines)
+        except:
+            block = self.dataParseEach(lines)
 
-            # Logs state event, update state object, update PID graphic (eventually)
-            self.logEvent("STATE",text)
+        parseTime = time.perf_counter()
 
-            # QUICK FIX FOR ABORT STATE 
-            if (text == "xLBabo"):
-                self.state.update("xLBrl10")
-                self.state.update("xLBrl20")
-            else:
-                self.state.update(text)
+        if (len(block) == 0):
+            return
+
+        try: 
+
+            # Populate data arrays: O(1) ring buffer append, oldest samples age out of window
+            self.data.extend(block)
+            self.state.data = True
+
+            if (self.state.log):
+                self.writer.put(self.archFile,block)
+
+            for tier in self.tier:
+                tier.extend(block)
+
+            self.trend.extend(block)
+            self.tank.update(self.data.tt[-1],self.data.pt[-1],self.state.runVt)
+
+            # Plots & readouts redrawn on next frame
+            self.dirty = True
+
+            if (readTime):
+                self.latencyAdd(np.array(readTime),emitTime,dispTime,parseTime,time.perf_counter())
+
+        except: 
+
+            # Throws error if failure to process data packets
+            self.logEvent("ERROR","DAQ FAIL")
 
+    def renderInit(self):
+
+        '''
+        Render Timer Initialization
+         - Plots & readouts redrawn at fixed frame rate, independent of packet rate
+        '''
+
+        self.frameRate = 25    # Max. redraws per second (fps)
+        self.dirty     = False # New data since last frame
+
+        self.renderTimer = QTimer(self)
+        self.renderTimer.timeout.connect(self.renderUpdate)
+        self.renderTimer.start(int(1000/self.frameRate))
+
+    def renderUpdate(self):
+
+        '''
+        Plot, Sensor Readout & LED Redraw (once per frame, only if changed)
+        '''
+
+        self.state.repaint()
+
+        if (not self.dirty):
+            return
+
+        self.dirty = False
+
+        try:
+            self.sensorRender()
+            self.plotRender()
         except:
-            self.logEvent("ERROR","STATE FAIL")
 
-    def dataUpdate(self,text): 
-        print("gets here, right?")
+            # Throws error if failure to draw data
+            self.logEvent("ERROR","RENDER FAIL")
+
+        # First render of packets stored since last frame
+        if (self.latency.pend):
+
+            now  = time.perf_counter()
+            read = np.concatenate([pend[0] for pend in self.latency.pend])
+
+            for pend in self.latency.pend:
+                self.latency.hist["render"].add(now - pend[1],len(pend[0]))
+
+            self.latency.hist["total"].add(now - read)
+            self.latency.pend = []
+
+    def diagInit(self):
+
         '''
-        Plot & Sensor Update
+        Packet Latency Diagnostics Initialization
+         - Per-stage histograms: read --> emit --> dispatch --> parse --> store --> first render
+         - Command send --> state echo read (per acknowledged command)
+         - Redundant links: per-member packets, loss & lag behind first copy
         '''
 
-        try: 
+        # Latency stage specification
+        # name, label
+        stageSpec = [( "batch",  "Batch Hold"),
+                     ( "queue",  "Signal Queue"),
+                     ( "parse",  "Parse"),
+                     ( "store",  "Store"),
+                     ("render",  "Render Wait"),
+                     ( "total",  "Read to Screen"),
+                     (   "ack",  "Command Ack")]
+
+        self.latency       = Object()
+        self.latency.name  = [spec[0] for spec in stageSpec]
+        self.latency.hist  = {}
+        self.latency.out   = {}
+        self.latency.pend  = [] # (read times, store time) awaiting first render
+
+        # Column headers
+        header = ["Latency","p50 [ms]","p95 [ms]","p99 [ms]","Packets"]
+
+        for j in range(len(header)):
+            self.constr.label(self.gridDiag,"label",header[j],"Center",[0,j,1,1])
+
+        for i in range(len(stageSpec)):
+
+            name = stageSpec[i][0]
+
+            self.latency.hist[name] = Histogram()
+            self.latency.out[name]  = []
+
+            self.constr.label(self.gridDiag,"label",stageSpec[i][1],"Center",[i + 1,0,1,1])
+
+            for j in range(1,len(header)):
+                self.latency.out[name].append(self.constr.readout(self.gridDiag,"sensor",[i + 1,j,1,1]))
+
+        # Link statistics: open link, or both members of Dual connection
+        self.latency.link     = [] # Readouts per row
+        self.latency.linkName = [] # Row labels (link name once connected)
+
+        row    = len(stageSpec) + 1
+        header = ["Link","Packets","First","Late","Loss [%]","Lag p50 [ms]","Partial","Garbage"]
+
+        for j in range(len(header)):
+            self.constr.label(self.gridDiag,"label",header[j],"Center",[row,j,1,1])
+
+        for i in range(2):
+
+            self.latency.linkName.append(self.constr.label(self.gridDiag,"label","-","Center",[row + i + 1,0,1,1]))
+            self.latency.link.append([])
+
+            for j in range(1,len(header)):
+                self.latency.link[i].append(self.constr.readout(self.gridDiag,"sensor",[row + i + 1,j,1,1]))
+
+        # Diagnostics refresh (1 Hz)
+        self.diagTimer = QTimer(self)
+        self.diagTimer.timeout.connect(self.diagUpdate)
+        self.diagTimer.start(1000)
+
+    def latencyAdd(self,read,emit,disp,parse,store):
+
+        '''
+        Record Ingest Latencies of One Packet Batch
+        '''
+
+        n    = len(read)
+        hist = self.latency.hist
+
+        hist["batch"].add(emit - read)
+        hist["queue"].add(disp - emit,n)
+        hist["parse"].add(parse - disp,n)
+        hist["store"].add(store - parse,n)
 
-            # Write to data log
-            if self.state.log:
-                self.dataFile.write(text + '\n')
-                print("writing")
+        self.latency.pend.append((read,store))
 
-            # Process data packet
-            raw  = text.split(',')
-            nEnd = len(self.data.st)
-            print(raw, nEnd)
+    def latencyText(self,name):
 
-            # Update dictionary --> maps code to reading
-            for field in raw:
-                self.dataDict[field[0:2]] = field[2:]
+        '''
+        Percentile Strings [ms] of One Stage
+        '''
 
-            # Convert time stamps to elapsed from AV start (first packet)
-            if (self.state.data):
+        text = []
 
-                stamp   = self.dataDict["st"]
-                nowData = datetime.strptime(stamp,"%H:%M:%S.%f")
-                delta   = nowData - self.startData
-                elapsed = delta.total_seconds()
+        for p in [50,95,99]:
 
-                self.dataDict["st"] = elapsed
+            value = self.latency.hist[name].percentile(p)
 
+            if (value is None):
+                text.append("-")
             else:
-                
-                stamp           = self.dataDict["st"]
-                self.startData  = datetime.strptime(stamp,"%H:%M:%S.%f")
-                self.state.data = True
+                text.append(str(round(1e3*value,2)))
+
+        return text
+
+    def diagUpdate(self):
+
+        '''
+        Latency Readout Refresh
+        '''
+
+        for name in self.latency.name:
+
+            text = self.latencyText(name) + [str(self.latency.hist[name].total())]
+
+            for j in range(len(text)):
+                if (self.latency.out[name][j].text() != text[j]):
+                    self.latency.out[name][j].setText(text[j])
+
+        linkText = self.linkText()
+
+        for i in range(len(self.latency.link)):
+
+            name,text = linkText[i] if (i < len(linkText)) else ("-",["-"]*len(self.latency.link[i]))
+
+            if (self.latency.linkName[i].text() != name):
+                self.latency.linkName[i].setText(name)
+
+            for j in range(len(text)):
+                if (self.latency.link[i][j].text() != text[j]):
+                    self.latency.link[i][j].setText(text[j])
+
+    def linkText(self):
 
-                self.dataDict["st"] = 0
+        '''
+        Link Statistics --> (name, [packets, first, late, loss %, lag p50 ms, partial, garbage])
+        '''
+
+        out = []
+
+        if (self.linkName is not None):
+            for name,packets,first,late,loss,lag,partial,garbage in self.linkThread.stats(self.linkName):
+                out.append((name,[str(packets),
+                                  "-" if (first is None) else str(first),
+                                  str(late),
+                                  "-" if (loss is None) else str(round(100*loss,2)),
+                                  "-" if (lag is None) else str(round(1e3*lag,2)),
+                                  str(partial),
+                                  str(garbage)]))
+
+        return out
+
+    def linkStats(self):
+
+        '''
+        Log Link Summary: packets, first copies, late, loss %, lag p50 [ms], partial & garbage frames
+        '''
+
+        if (self.state.log):
+            for name,text in self.linkText():
+                self.logEvent("LINK STATS",name + ' ' + ' '.join(text))
+
+    def sensorRender(self):
+
+        '''
+        Sensor Readout Update --> extrapolation; unchanged text not redrawn
+        '''
+
+        if (len(self.data) == 0):
+            return
+
+        for name in self.sensorName:
+
+            sensor = getattr(self.sensor,name)
+            prefix = ""
 
-            # Establish extrapolation time step
-            if (len(self.data.st) < 2):
-                step = 1 # Arbitrary value; can't be zero
+            if (sensor.extrap > 0):
+                value = self.trend.extrap(sensor.code,sensor.extrap) # Fit over past sensor.extrap sec
+            elif (sensor.code == "mass"): # Run tank estimate, not a data channel
+                value  = self.tank.mass
+                prefix = "≤ " if (self.tank.bound) else "" # Vented --> level at or below dip tube
+            elif (sensor.code == "ullage"):
+                value  = 100*self.tank.ullage
+                prefix = "≥ " if (self.tank.bound) else ""
             else:
-                step = self.data.st[-1] - self.data.st[-2]
+                value = getattr(self.data,sensor.code)[-1]
 
-            nData = np.floor(self.dataTime/step)
+            if (name == "pRunVap"): # Vapor pressure from run tank temp
+                value = self.tools.vapPress(value)
 
-            # Populate data arrays: after filling array, delete first element & append to end
-            if (nEnd < nData): # Case: array not full
+            # No estimate (no table entry) --> dash, not "nan"
+            text = prefix + str(round(value,2)) if (np.isfinite(value)) else "-"
 
-                for name in self.dataName:
+            if (text != sensor.shown):
+                sensor.setText(text)
+                sensor.shown = text
 
-                    value = float(self.dataDict[name])
-                    setattr(self.data,name,np.append(getattr(self.data,name),value))
+    def plotRender(self):
 
-            else: # Case: array full
+        '''
+        Live Plot Update
+        '''
 
-                for name in self.dataName:
+        if (not self.plot) or (len(self.data) == 0):
+            return
 
-                    value = float(self.dataDict[name])
-                    getattr(self.data,name,np.roll(getattr(self.data,name),-1))
-                    getattr(self.data,name)[-1] = value
+        self.plotDraw(self.plot[0],self.plotPress,"pt",self.style.pen.press)
+        self.plotDraw(self.plot[0],self.plotVap,"tt",self.style.pen.vap,self.tools.vapLookup)
+        self.plotDraw(self.plot[1],self.plotTemp,"tt",self.style.pen.temp)
 
-            # Sensor readout update
-            for name in self.sensorName:
+    def plotDraw(self,plot,curve,code,pen,func=None):
 
-                sensor = getattr(self.sensor,name)
-                data   = getattr(self.data,sensor.code)
-                value  = self.tools.extrap(self.data.st,data,sensor.extrap,step)
+        '''
+        Decimated Curve Update --> at most ~2 points per pixel column
+         - Visible time span picks full-rate data or coarsest sufficient history tier
+         - func: vectorized, monotonic map of channel (e.g. vapLookup), applied after decimation
+        '''
 
-                if (name == "pRunVap"): # Vapor pressure from run tank temp
-                    value = self.tools.vapPress(value)
+        viewBox = plot.getViewBox()
+        now     = self.data.st[-1] # Center time scale at present reading
 
-                sensor.setText(str(round(value,2)))
+        # Auto-ranged axis follows full-rate data; otherwise user's zoomed view
+        if (viewBox.autoRangeEnabled()[0]):
+            xRange = None
+            span   = 0
+        else:
+            xRange = viewBox.viewRange()[0]
+            span   = xRange[1] - xRange[0]
 
-            # Live plot update
-            #xTime  = self.data.st - self.data.st[-1] # Center time scale at present reading 
-            xTime = [1,2,3,4,5,6,7,8,9,10]
-            yPress = [400,432,434,432,433,431,429,432,435,445]
-            print(xTime)
-            print("YPress:")
-            print(yPress)
-            #yPress = self.data.pt # Tank pressure array
-            yTemp  = self.data.tt # Tank temperature array 
-            print("yTemp:")
-            print(yTemp)
+        if (span <= self.dataTime):
 
-            self.plotPress.setData(xTime,yPress,pen=self.style.pen.press)
-            self.plotTemp.setData(xTime,yTemp,pen=self.style.pen.temp)
+            x = self.data.st - now
+            y = getattr(self.data,code)
 
-        except: 
+        else:
 
-            # Throws error if failure to read data packet
-            self.logEvent("ERROR","DAQ FAIL")
+            tier = self.tier[-1]
 
-            if (self.state.log):
-                self.dataFile.write("ERROR: " + text + '\n')
-                
-    def readFail(self,text):
+            for option in self.tier:
+                if (option.span >= span) and (len(option) > 0):
+                    tier = option
+                    break
+
+            x,y = tier.envelope(code)
+            x   = x - now
+
+        if (len(x) == 0):
+            return
+
+        if (xRange is None):
+            xRange = [x[0],x[-1]]
+
+        x,y = self.tools.decimate(x,y,xRange,viewBox.width())
+
+        # Monotonic --> min/max per pixel column preserved
+        if (func is not None):
+            y = func(y)
+
+        # Missing (NaN) readings or gap rows present --> break line there instead of bridging
+        finite = bool(np.all(np.isfinite(y)))
+
+        curve.setData(x,y,pen=pen,skipFiniteCheck=finite,connect="all" if (finite) else "finite")
+
+    def dataParseEach(self,lines):
 
         '''
-        Log Read Fail & Reset Connection
+        Packet-by-Packet Parse Fallback
         '''
 
-        self.btnClkRes()
-        self.logEvent("ERROR",text)
+        rows = []
+
+        for text in lines:
+
+            try:
+                rows.append(self.parser.parseLines([text])[0])
+            except:
+
+                # Throws error if failure to read data packet
+                self.logEvent("ERROR","DAQ FAIL")
+
+                if (self.state.log):
+                    self.writer.put(self.dataFile,"ERROR: " + text + '\n')
+
+        return np.array(rows)
 
     def logEvent(self,event,text): 
         
@@ -1077,7 +1681,18 @@ class Gui(QMainWindow):
 
         # Print to log file
         if (self.state.log):
-            self.logFile.write(stamp + ", " + event + ", " + "\"" + text + "\"" + "\n")
+            self.writer.put(self.logFile,stamp + ", " + event + ", " + "\"" + text + "\"" + "\n")
+
+    def writeReport(self,depth,dropped):
+
+        '''
+        File Writer Backpressure Report
+        '''
+
+        if (dropped > 0):
+            self.logEvent("ERROR","WRITE DROP " + str(dropped))
+        else:
+            self.logEvent("ERROR","WRITE BACKLOG " + str(depth) + " (" + str(round(100*self.writer.backlog())) + "% full)")
 
     def closeLog(self):
 
@@ -1087,8 +1702,32 @@ class Gui(QMainWindow):
 
         if (self.state.log):
 
+            # Latency summary: p50, p95, p99 [ms], packets
+            for name in self.latency.name:
+                text = self.latencyText(name) + [str(self.latency.hist[name].total())]
+                self.logEvent("LATENCY",name + ' ' + ' '.join(text))
+
+            self.linkStats()
+
+            # File writer summary: peak queue depth, records dropped
+            self.logEvent("WRITER","peak " + str(self.writer.peak) + " of " + str(self.writer.queue.maxsize) + ", dropped " + str(self.writer.dropped))
+
+            # State transition summary: state, count
+            count = self.state.transitions()
+            text  = [name + ' ' + str(count[name]) for name in count if (count[name] > 0)]
+
+            if (text):
+                self.logEvent("TRANSITIONS",', '.join(text))
+
+            # Startup timing [ms]
+            if (self.boot.text):
+                self.logEvent("STARTUP",self.boot.text)
+
             self.state.log = False # Protects thread issues; writing to closed file
-            fileObj = ["logFile","dataFile"]
+            fileObj = ["logFile","dataFile","archFile"]
+
+            # Write out queued records before close & rename
+            self.writer.release([getattr(self,logName) for logName in fileObj])
 
             for logName in fileObj:
 
@@ -1108,6 +1747,9 @@ class Gui(QMainWindow):
 
         # Close log & data files if initialized
         self.closeLog()
+        self.scanThread.stop()
+        self.linkThread.stop()
+        self.writer.stop()
 
         # Exit GUI safely
         event.accept()
@@ -0,0 +1,882 @@
+# -*- coding: utf-8 -*-
+'''
+Texas A&M University Sounding Rocketry Team
+SRT-9 | 2021-2022
+
+%-------------------------------------------------------------%
+                            TAMU SRT
+  _____                      __  _____          __           __
+ / ___/______  __ _____  ___/ / / ___/__  ___  / /________  / /
+/ (_ / __/ _ \/ // / _ \/ _  / / /__/ _ \/ _ \/ __/ __/ _ \/ /
+\___/_/  \___/\_,_/_//_/\_,_/  \___/\___/_//_/\__/_/  \___/_/
+
+%-------------------------------------------------------------%
+
+Filepath:
+    gc/srt_gc_launchGui/srt_gc_launchLink.py
+
+Developers:
+    (C) Ground Control Team    20261018
+    (L) Ground Control Team    ########
+
+Description:
+    Transport links (TCP, serial, replay) on one asyncio event loop in one worker thread.
+     - Transport chosen explicitly per link, never guessed from a failed call
+     - Non-blocking reads & writes; any number of links w/o a thread per link
+     - Connect, disconnect & errors reported as signals, per link name
+     - Per-link phases: connecting --> handshaking --> (bypass) --> reading; failed on error or timeout
+     - Link lost after connecting --> reconnecting w/ exponential backoff & jitter, until removed
+     - Control commands through CommandQueue: prioritized, rate-limited, acknowledged by state echo
+     - Link groups (XBee + Wi-Fi): all members read, first copy of each packet forwarded,
+       commands sent on healthiest member; group lost only when every member is down
+    Python 3.6 compatible: new_event_loop(), run_forever(), ensure_future()
+
+Input(s):
+    <None>
+
+Output(s):
+    <None>
+'''
+
+# Installed modules --> Utilities
+import os
+import time
+import random
+import asyncio
+import threading
+import collections
+import serial
+
+# Installed modules --> PyQt related
+from PyQt5.QtCore import (QThread, pyqtSignal)
+
+# Program modules
+from srt_gc_launchThread  import Framer, Batcher
+from srt_gc_launchCommand import CommandQueue
+from srt_gc_launchTools   import Histogram
+from srt_gc_launchData    import StampParser
+
+class Link():
+
+    '''
+    Transport Link Base
+     - open(), read() & close() per transport; read() returns b'' only at end of stream
+     - Complete lines --> owning LinkThread
+     - Phase changes --> LinkThread.phaseSig; first lines in any phase --> reading
+    '''
+
+    # Sent once open; board streams after it (router link dropped w/o traffic)
+    hello = b'b'
+
+    # XBee (old firmware) bypass: bytes, wait after (sec)
+    bypassSpec = [(b'\r\n\r\n',2.0),
+                  (   b'b\r\n',0.0)]
+
+    reconnect = True # Reopen after link lost (once connected)
+
+    def __init__(self,name):
+
+        self.name      = name
+        self.thread    = None  # Owning LinkThread, set on add
+        self.group     = None  # LinkGroup name, if redundant member
+        self.framer    = Framer()
+        self.connected = False
+        self.opened    = 0     # Opens so far --> timers & bypass tied to one connection
+        self.phase     = None
+        self.up        = False # Connected at least once
+        self.streamed  = False # Lines read since last open
+        self.bypassed  = False # Data only came after bypass --> repeat on reconnect
+
+    async def open(self):
+
+        raise NotImplementedError
+
+    async def read(self):
+
+        raise NotImplementedError
+
+    def write(self,data):
+
+        raise NotImplementedError
+
+    def close(self):
+
+        pass
+
+    def setPhase(self,phase):
+
+        self.phase = phase
+        self.thread.phaseSig.emit(self.name,phase)
+
+        if (self.group is not None):
+            self.thread.groups[self.group].update()
+
+    def live(self,opened,phase):
+
+        '''
+        Same Connection Still Open & in phase (checked after every wait)
+        '''
+
+        return (self.connected) and (self.opened == opened) and (self.phase == phase)
+
+    def expect(self,phase,text):
+
+        '''
+        Arm Timeout: no data by handTime --> report, await bypass or late data (link kept open)
+         - Timer from earlier connection (link lost & reopened meanwhile) ignored
+        '''
+
+        opened = self.opened
+
+        def expire():
+
+            if (self.live(opened,phase)):
+                self.thread.errSig.emit(self.name,text)
+
+                if (phase == "bypass"):
+                    self.setPhase("handshaking")
+                elif (self.bypassed):
+                    asyncio.ensure_future(self.bypass())
+
+        asyncio.get_event_loop().call_later(self.thread.handTime,expire)
+
+    async def bypass(self):
+
+        '''
+        XBee Bypass Sequence (non-blocking waits)
+        '''
+
+        if (not self.connected) or (self.phase not in ["handshaking","bypass"]):
+            return
+
+        opened = self.opened
+        self.setPhase("bypass")
+
+        for data,wait in self.bypassSpec:
+
+            # Link lost (or data arrived) during wait --> sequence abandoned
+            if (not self.live(opened,"bypass")):
+                return
+
+            self.write(data)
+            await asyncio.sleep(wait)
+
+        if (self.live(opened,"bypass")):
+            self.expect("bypass","BYPASS TIMEOUT")
+
+    async def run(self):
+
+        '''
+        Connect, Handshake, Read Until Closed or Failed, Report --> reason
+        '''
+
+        reason        = "CLOSED"
+        self.streamed = False
+
+        try:
+
+            # Fresh port/socket per attempt
+            self.setPhase("connecting")
+            await asyncio.wait_for(self.open(),self.thread.connTime)
+
+            self.opened   += 1
+            self.connected = True
+            self.up        = True
+            self.framer.reset()
+
+            self.setPhase("handshaking")
+            self.write(self.hello)
+            self.expect("handshaking","HANDSHAKE TIMEOUT")
+
+            while (True):
+
+                data = await self.read()
+                read = time.perf_counter() # Packet latency reference
+
+                if (not data):
+                    reason = "CLOSED BY PEER"
+                    break
+
+                lines = self.framer.feed(data)
+
+                if (lines):
+
+                    if (self.phase != "reading"):
+                        self.bypassed = (self.phase == "bypass") or (self.bypassed)
+                        self.streamed = True
+                        self.setPhase("reading")
+
+                    self.thread.deliver(self,lines,read)
+
+        except asyncio.CancelledError:
+
+            reason = "CLOSED"
+
+        except Exception as error:
+
+            if (isinstance(error,asyncio.TimeoutError)):
+                error = "TIMEOUT"
+
+            reason = ("READ FAIL" if (self.connected) else "CONNECT FAIL")
+            self.thread.errSig.emit(self.name,reason + ": " + (str(error) or type(error).__name__))
+
+        finally:
+
+            self.close()
+
+            if (self.connected):
+                self.connected = False
+                self.thread.batcher.flush() # Deliver lines read before close
+                self.thread.discSig.emit(self.name,reason)
+
+                if (self.group is not None):
+                    self.thread.groups[self.group].down(reason)
+
+        return reason
+
+class TcpLink(Link):
+
+    '''
+    TCP Socket Link (router / simulator); fresh socket per open()
+    '''
+
+    def __init__(self,name,host,port):
+
+        Link.__init__(self,name)
+
+        self.host    = host
+        self.port    = port
+        self.reader  = None
+        self.writer  = None
+
+    async def open(self):
+
+        self.reader, self.writer = await asyncio.open_connection(self.host,self.port)
+
+    async def read(self):
+
+        return await self.reader.read(4096)
+
+    def write(self,data):
+
+        self.writer.write(data) # Buffered by transport, never blocks
+
+    def close(self):
+
+        if (self.writer is not None):
+            self.writer.close()
+            self.writer = None
+
+class SerialLink(Link):
+
+    '''
+    Serial Port Link (XBee)
+     - Port opened on worker thread (blocking driver call) --> bounded by connTime, other links keep running
+     - POSIX: port fd watched by event loop --> read on readiness
+     - Otherwise: input buffer polled every poll sec
+    '''
+
+    def __init__(self,name,port,baud,poll=0.01):
+
+        Link.__init__(self,name)
+
+        self.port  = port
+        self.baud  = baud
+        self.poll  = poll
+        self.ser   = None
+        self.ready = None
+        self.fd    = None
+
+    async def open(self):
+
+        loop   = asyncio.get_event_loop()
+        future = loop.run_in_executor(None,lambda: serial.Serial(self.port,self.baud,timeout=0)) # timeout=0 --> read never blocks
+
+        # Timed out (run's wait_for) --> open keeps going on worker; port closed once it returns
+        try:
+            self.ser = await asyncio.shield(future)
+        except asyncio.CancelledError:
+            future.add_done_callback(self.abandon)
+            raise
+
+        if (os.name == "posix"):
+            self.fd    = self.ser.fileno()
+            self.ready = asyncio.Event()
+            loop.add_reader(self.fd,self.ready.set)
+
+    def abandon(self,future):
+
+        if (not future.cancelled()) and (future.exception() is None):
+            future.result().close()
+
+    async def read(self):
+
+        while (True):
+
+            if (self.ready is not None):
+                await self.ready.wait()
+                self.ready.clear()
+
+                # Readable w/ no data --> device gone, pyserial raises
+                # Empty read --> stale readiness, already drained
+                data = self.ser.read(max(self.ser.in_waiting,1))
+
+            else:
+                await asyncio.sleep(self.poll)
+                data = self.ser.read(self.ser.in_waiting)
+
+            if (data):
+                return data
+
+    def write(self,data):
+
+        self.ser.write(data) # Commands are a few bytes --> OS buffer never fills
+
+    def close(self):
+
+        if (self.fd is not None):
+            asyncio.get_event_loop().remove_reader(self.fd)
+            self.fd = None
+
+        if (self.ser is not None):
+            self.ser.close()
+            self.ser = None
+
+class PollLink(Link):
+
+    '''
+    Pyserial-like Source Link (Replay); in_waiting polled every poll sec, idle once exhausted
+    '''
+
+    reconnect = False # Source closed w/ link, can't be reopened
+
+    def __init__(self,name,source,poll=0.01):
+
+        Link.__init__(self,name)
+
+        self.source = source
+        self.poll   = poll
+
+    async def open(self):
+
+        pass
+
+    async def read(self):
+
+        while (True):
+
+            n = self.source.in_waiting
+
+            if (n > 0):
+                await asyncio.sleep(0) # Source never empty (fast replay, benchmark) --> other links still run
+                return self.source.read(n)
+
+            await asyncio.sleep(self.poll)
+
+    def write(self,data):
+
+        self.source.write(data)
+
+    def close(self):
+
+        self.source.close()
+
+class LinkStat():
+
+    '''
+    Per-Member Link Statistics
+    '''
+
+    alpha = 0.05 # Recent loss & lag smoothing (per packet)
+
+    def __init__(self):
+
+        self.packets = 0           # Data packets delivered (incl. late)
+        self.first   = 0           # " " delivered before any other member
+        self.late    = 0           # " " at/before newest forwarded stamp, after leaving window
+        self.lag     = Histogram() # Delay behind first copy [sec]
+        self.lossAvg = 0.0         # Recent miss fraction (late counts as missed)
+        self.lagAvg  = 0.0         # Recent delay behind first copy [sec]
+
+    def loss(self,forwarded):
+
+        '''
+        Fraction of Group's Forwarded Packets Never Delivered by Member
+        '''
+
+        return max(1 - self.packets/forwarded,0.0) if (forwarded > 0) else None
+
+class LinkGroup():
+
+    '''
+    Redundant Link Group
+     - Data packets keyed by "st" stamp in window of last size stamps; first copy forwarded
+     - Stamp at/before newest forwarded one & out of window --> late copy, never forwarded
+       (stream stays in order however far a member lags; stamp > resync sec older --> new AV clock)
+     - Other lines (state echoes, text): nth copy within echoTime forwarded from first member to deliver it
+     - Packet leaving window --> recent miss for members that have not delivered it (command link choice)
+     - Group phase: most advanced member phase; group down once no member connected
+    '''
+
+    rank = ["failed","reconnecting","connecting","handshaking","bypass","reading"]
+
+    def __init__(self,thread,name,links,size=64,echoTime=0.25,resync=10.0):
+
+        self.thread   = thread
+        self.name     = name
+        self.links    = links    # Member links
+        self.size     = size     # Stamp window (packets)
+        self.echoTime = echoTime # Max. delay between copies of one non-data line (sec)
+        self.resync   = resync   # Stamp this far before newest --> AV clock reset (sec)
+        self.phase    = None
+
+        self.seen      = {} # Stamp --> (first read time, set of member names)
+        self.order     = collections.deque()
+        self.stamp     = StampParser()
+        self.newest    = None # Newest forwarded stamp (sec)
+        self.forwarded = 0    # Data packets forwarded
+        self.recent = {} # Non-data line --> (first read time, {member name: copies})
+        self.stat   = {}
+
+        for link in links:
+            link.group          = name
+            self.stat[link.name] = LinkStat()
+
+    def filter(self,link,lines,read):
+
+        '''
+        Member's Lines --> lines not already forwarded by another member
+        '''
+
+        stat = self.stat[link.name]
+        out  = []
+
+        for text in lines:
+
+            if (text[0:2] == "st"):
+
+                key   = text.split(',',1)[0]
+                entry = self.seen.get(key)
+
+                stat.packets += 1
+
+                if (entry is None):
+
+                    try:
+                        stamp = self.stamp.parse(key[2:])
+                    except ValueError:
+                        stamp = None # Left to packet parser to reject
+
+                    late = (stamp is not None) and (self.newest is not None) and \
+                           (self.newest - self.resync < stamp <= self.newest)
+
+                    if (late):
+                        stat.late += 1
+                        continue
+
+                    if (stamp is not None):
+                        self.newest = stamp
+
+                    self.seen[key]  = (read,{link.name})
+                    self.forwarded += 1
+                    self.order.append(key)
+
+                    stat.first  += 1
+                    stat.lagAvg -= stat.alpha*stat.lagAvg
+                    out.append(text)
+
+                    if (len(self.order) > self.size):
+                        self.evict()
+
+                else:
+
+                    lag = read - entry[0]
+                    entry[1].add(link.name)
+
+                    stat.lag.add(lag)
+                    stat.lagAvg += stat.alpha*(lag - stat.lagAvg)
+
+            else:
+
+                entry = self.recent.get(text)
+
+                if (entry is None) or (read - entry[0] >= self.echoTime):
+                    entry             = (read,{})
+                    self.recent[text] = entry
+
+                # Repeated line (e.g. one echo per command) --> each repeat forwarded once
+                count = entry[1].get(link.name,0) + 1
+                entry[1][link.name] = count
+
+                if (count > max([entry[1][name] for name in entry[1] if (name != link.name)],default=0)):
+                    out.append(text)
+
+        # Bound echo table
+        if (len(self.recent) > 64):
+            self.recent = {text: entry for text,entry in self.recent.items() if (read - entry[0] < self.echoTime)}
+
+        return out
+
+    def evict(self):
+
+        key   = self.order.popleft()
+        entry = self.seen.pop(key)
+
+        for name in self.stat:
+
+            stat   = self.stat[name]
+            missed = (name not in entry[1])
+
+            stat.lossAvg += stat.alpha*(missed - stat.lossAvg)
+
+    def pick(self):
+
+        '''
+        Healthiest Connected Member: reading first, then lowest recent loss, then lowest lag
+        '''
+
+        best = None
+
+        for link in self.links:
+
+            if (not link.connected):
+                continue
+
+            stat  = self.stat[link.name]
+            score = (link.phase != "reading",round(stat.lossAvg,2),stat.lagAvg)
+
+            if (best is None) or (score < best[0]):
+                best = (score,link)
+
+        return None if (best is None) else best[1]
+
+    def update(self):
+
+        '''
+        Member Phase Changed --> report group phase if changed
+        '''
+
+        phase = max([link.phase for link in self.links if (link.phase in self.rank)],key=self.rank.index,default=None)
+
+        if (phase is not None) and (phase != self.phase):
+            self.phase = phase
+            self.thread.phaseSig.emit(self.name,phase)
+
+    def down(self,reason):
+
+        if (not any(link.connected for link in self.links)):
+            self.thread.discSig.emit(self.name,reason)
+
+    def stats(self):
+
+        '''
+        Member Statistics --> list of (name, packets, first copies, late packets, loss fraction, lag p50 [sec])
+        '''
+
+        return [(name,stat.packets,stat.first,stat.late,stat.loss(self.forwarded),stat.lag.percentile(50))
+                for name,stat in self.stat.items()]
+
+class LinkThread(QThread):
+
+    '''
+    Event Loop Thread for All Links
+     - add(), remove(), send() & stop() safe to call from GUI thread
+     - Lines from all links batched together (Batcher)
+    '''
+
+    # Batched lines --> GUI slots
+    outSig   = pyqtSignal(list)
+    stateSig = pyqtSignal(list)
+    dataSig  = pyqtSignal(list,list,float)
+
+    # Link events: name, phase; name, reason
+    phaseSig = pyqtSignal(str,str)
+    discSig  = pyqtSignal(str,str)
+    errSig   = pyqtSignal(str,str)
+
+    # Command events: command name, event, ack latency (sec), attempts
+    commSig  = pyqtSignal(str,str,float,int)
+
+    def __init__(self,batchTime=0,batchSize=1,connTime=5.0,handTime=1.0,retryTime=[0.1,5.0],jitter=0.5,
+                 commTime=[0.1,1.0],retries=2):
+
+        QThread.__init__(self)
+
+        self.connTime  = connTime  # Max. time to open port/socket (sec)
+        self.handTime  = handTime  # Max. wait for first data after hello/bypass (sec)
+        self.retryTime = retryTime # Reconnect delay: first, max. (sec); doubles per failed attempt
+        self.jitter    = jitter    # Max. random fraction taken off each delay
+
+        self.batcher  = Batcher(self,batchTime,batchSize)
+        self.commands = CommandQueue(self,commTime[0],commTime[1],retries) # Send gap, ack timeout
+        self.loop    = None
+        self.links   = {} # Name --> Link
+        self.tasks   = {} # Name --> Future running Link.run()
+        self.groups  = {} # Name --> LinkGroup
+        self.ready   = threading.Event() # Event loop created
+
+    def __del__(self):
+
+        self.wait()
+
+    def run(self):
+
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+        tick = asyncio.ensure_future(self.tick(),loop=self.loop)
+        self.ready.set()
+
+        self.loop.run_forever()
+
+        # Stopped --> close every link, reporting disconnects
+        tick.cancel()
+
+        for task in self.tasks.values():
+            task.cancel()
+
+        pend = [tick] + list(self.tasks.values())
+        self.loop.run_until_complete(asyncio.gather(*pend,return_exceptions=True))
+        self.loop.close()
+
+        self.links  = {}
+        self.tasks  = {}
+        self.groups = {}
+
+    async def tick(self):
+
+        '''
+        Emit Held Lines Once batchTime Elapsed, Even if No Link Reads
+        '''
+
+        while (True):
+            await asyncio.sleep(max(self.batcher.batchTime,0.01))
+            self.batcher.due()
+
+    def deliver(self,link,lines,read):
+
+        if (link.group is not None):
+
+            lines = self.groups[link.group].filter(link,lines,read)
+
+            if (not lines):
+                return
+
+        self.commands.match(lines,read)
+        self.batcher.add(lines,read)
+
+    def call(self,func,*args):
+
+        '''
+        Run func(*args) on Event Loop (thread-safe)
+        '''
+
+        self.ready.wait()
+        self.loop.call_soon_threadsafe(func,*args)
+
+    def add(self,link):
+
+        '''
+        Start Link (connects in background; phaseSig & errSig follow)
+        '''
+
+        link.thread = self
+        self.call(self.startLink,link)
+
+    def startLink(self,link):
+
+        old = self.tasks.get(link.name)
+
+        if (old is not None):
+            old.cancel()
+
+        self.links[link.name] = link
+        self.tasks[link.name] = asyncio.ensure_future(self.supervise(link),loop=self.loop)
+        self.tasks[link.name].add_done_callback(lambda task: self.endLink(link,task))
+
+    def addGroup(self,name,links):
+
+        '''
+        Start Redundant Link Group; name then used for send, command, bypass & remove
+        '''
+
+        for link in links:
+            link.thread = self
+
+        self.call(self.startGroup,name,links)
+
+    def startGroup(self,name,links):
+
+        self.stopLink(name)
+        self.groups[name] = LinkGroup(self,name,links)
+
+        for link in links:
+            self.startLink(link)
+
+    async def supervise(self,link):
+
+        '''
+        Run Link; Once It Has Connected, Reopen After Every Loss Until Removed
+         - Delay doubles per attempt w/o data, capped; reset once lines flow again
+         - Never connected (wrong port, no router) --> failed, no retry
+        '''
+
+        attempt = 0
+
+        while (True):
+
+            reason = await link.run()
+
+            if (reason == "CLOSED"):
+                return # Removed
+
+            if (not link.reconnect) or (not link.up):
+                link.setPhase("failed")
+                return
+
+            if (link.streamed):
+                attempt = 0
+
+            delay    = min(self.retryTime[0]*2**attempt,self.retryTime[1])
+            delay   *= 1 - self.jitter*random.random()
+            attempt += 1
+
+            link.setPhase("reconnecting")
+            await asyncio.sleep(delay)
+
+    def endLink(self,link,task):
+
+        if (self.tasks.get(link.name) is task):
+            del self.tasks[link.name]
+            del self.links[link.name]
+
+        group = self.groups.get(link.group)
+
+        if (group is not None) and (not any(member.name in self.tasks for member in group.links)):
+            del self.groups[link.group]
+
+    def remove(self,name):
+
+        '''
+        Close Link (discSig follows if connected)
+        '''
+
+        self.call(self.stopLink,name)
+
+    def stopLink(self,name):
+
+        self.commands.drop(name)
+
+        if (name in self.groups):
+            for link in self.groups[name].links:
+                self.stopLink(link.name)
+
+        task = self.tasks.get(name)
+
+        if (task is not None):
+            task.cancel()
+
+    def bypass(self,name):
+
+        '''
+        Run Link's Bypass Sequence (handshake got no data)
+        '''
+
+        self.call(self.bypassLink,name)
+
+    def bypassLink(self,name):
+
+        if (name in self.groups):
+            links = [link for link in self.groups[name].links if (link.connected)]
+        else:
+            links = [link for link in [self.links.get(name)] if (link is not None) and (link.connected)]
+
+        if (not links):
+            self.errSig.emit(name,"BYPASS FAIL: NO CONNECTION")
+            return
+
+        for link in links:
+            asyncio.ensure_future(link.bypass(),loop=self.loop)
+
+    def send(self,name,data,delay=0):
+
+        '''
+        Queue Write on Link, Optionally After delay sec (never blocks caller)
+        '''
+
+        self.call(self.sendLater,name,data,delay)
+
+    def sendLater(self,name,data,delay):
+
+        if (delay > 0):
+            self.loop.call_later(delay,self.sendLater,name,data,0)
+            return
+
+        self.commWrite(name,data)
+
+    def command(self,name,comm,data):
+
+        '''
+        Queue Control Command on Link (commSig reports send, ack, retry, timeout)
+        '''
+
+        self.call(self.commands.put,name,comm,data)
+
+    def commWrite(self,name,data):
+
+        '''
+        Write Now on Event Loop --> True if written
+         - Group --> healthiest connected member (retries may go out on another)
+        '''
+
+        if (name in self.groups):
+            link = self.groups[name].pick()
+        else:
+            link = self.links.get(name)
+
+        if (link is None) or (not link.connected):
+            self.errSig.emit(name,"WRITE FAIL: NO CONNECTION")
+            return False
+
+        try:
+            link.write(data)
+        except Exception as error:
+            self.errSig.emit(name,"WRITE FAIL: " + (str(error) or type(error).__name__))
+            return False
+
+        return True
+
+    def stats(self,name):
+
+        '''
+        Link or Group Member Statistics --> list of
+        (name, packets, first copies, late packets, loss fraction, lag p50 [sec], partial frames, garbage frames)
+         - Single link: packets = lines framed; first, late, loss & lag only for group members
+        '''
+
+        group = self.groups.get(name)
+
+        if (group is not None):
+            links = group.links
+            dedup = {row[0]: row[1:] for row in group.stats()}
+        else:
+            links = [link for link in [self.links.get(name)] if (link is not None)]
+            dedup = {}
+
+        out = []
+
+        for link in links:
+            row = dedup.get(link.name,(link.framer.packets,None,0,None,None))
+            out.append((link.name,) + tuple(row) + (link.framer.partial,link.framer.garbage))
+
+        return out
+
+    def stop(self):
+
+        '''
+        Close All Links & End Thread
+        '''
+
+        if (self.isRunning()):
+            self.call(self.loop.stop)
+            self.wait()
@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+'''
+Texas A&M University Sounding Rocketry Team
+SRT-9 | 2021-2022
+
+%-------------------------------------------------------------%
+                            TAMU SRT
+  _____                      __  _____          __           __
+ / ___/______  __ _____  ___/ / / ___/__  ___  / /________  / /
+/ (_ / __/ _ \/ // / _ \/ _  / / /__/ _ \/ _ \/ __/ __/ _ \/ /
+\___/_/  \___/\_,_/_//_/\_,_/  \___/\___/_//_/\__/_/  \___/_/
+
+%-------------------------------------------------------------%
+
+Filepath:
+    gc/srt_gc_launchGui/srt_gc_launchN2O.py
+
+Developers:
+    (C) Ground Control Team    20261018
+    (L) Ground Control Team    ########
+
+Description:
+    Saturated nitrous oxide properties & run tank load estimate.
+     - Property table: ESDU 91022 density & enthalpy correlations sampled once vs. temperature;
+       pressure from Tools.vapPress (same N2O vapor pressure as readout & plot)
+     - Tank estimate: loaded mass & ullage from run tank temperature & pressure (unknown while filling)
+
+Input(s):
+    <None>
+
+Output(s):
+    <None>
+'''
+
+# Installed modules --> Utilities
+import numpy as np
+
+# Program modules
+from srt_gc_launchTools import Tools
+
+class SatTable():
+
+    '''
+    Saturated N2O Property Table
+     - pSat [psi], rhoLiq & rhoVap [lb/ft³], hLiq & hVap [BTU/lb] vs. temperature [°F]
+     - Uniform grid, vectorized linear interpolation (scalar or array); NaN outside range
+     - err: max. relative interpolation error per property, checked at cell midpoints
+    '''
+
+    name = ["pSat","rhoLiq","rhoVap","hLiq","hVap"]
+
+    # ESDU 91022 critical point & coefficients [K, kg/m³, kJ/kg]
+    Tc   = 309.57
+    rhoc = 452.0
+
+    bRhoLiq = [1.72328, -0.8395, 0.5106, -0.10412]
+    bRhoVap = [-1.009, -6.28792, 7.50332, -7.90463, 0.629427]
+    bHLiq   = [-200.0, 116.043, -917.225, 794.779, -589.587]
+    bHVap   = [-200.0, 440.055, -459.701, 434.081, -485.338]
+
+    # SI --> GUI units
+    rho2lb  = 0.06242796 # kg/m³ --> lb/ft³
+    kj2btu  = 0.4299226  # kJ/kg --> BTU/lb
+
+    def __init__(self,tRange=[-130.0,96.5],step=0.05):
+
+        # Correlations valid -90 to 36 °C
+        n = int(round((tRange[1] - tRange[0])/step)) + 1
+
+        self.T     = tRange[0] + step*np.arange(n)
+        self.value = self.exact(self.T)
+        self.err   = {}
+
+        mid = self.exact(self.T[:-1] + step/2)
+
+        for name in self.name:
+            table          = self.value[name]
+            self.err[name] = float(np.max(np.abs(0.5*(table[:-1] + table[1:])/mid[name] - 1)))
+
+    def exact(self,T0):
+
+        '''
+        Closed-Form Saturated Properties (dict of arrays)
+        '''
+
+        T  = (np.asarray(T0,dtype=np.float64) + 459.67)*5/9 # °F --> K
+        Tr = T/self.Tc
+        x  = 1 - Tr
+        y  = 1/Tr - 1
+
+        out = {}
+
+        out["pSat"] = Tools().vapPress(np.asarray(T0,dtype=np.float64))
+
+        r = 0
+        for i,b in enumerate(self.bRhoLiq):
+            r = r + b*x**((i + 1)/3)
+
+        out["rhoLiq"] = self.rhoc*np.exp(r)*self.rho2lb
+
+        r = 0
+        for i,b in enumerate(self.bRhoVap):
+            r = r + b*y**((i + 1)/3)
+
+        out["rhoVap"] = self.rhoc*np.exp(r)*self.rho2lb
+
+        for name,coef in [("hLiq",self.bHLiq),("hVap",self.bHVap)]:
+
+            h = coef[0]
+            for i in range(1,len(coef)):
+                h = h + coef[i]*x**(i/3)
+
+            out[name] = h*self.kj2btu
+
+        return out
+
+    def lookup(self,name,T0):
+
+        '''
+        Interpolated Property at Temperature(s) [°F]
+        '''
+
+        return np.interp(T0,self.T,self.value[name],left=np.nan,right=np.nan)
+
+    def tSat(self,p):
+
+        '''
+        Saturation Temperature [°F] at Pressure(s) [psi]
+        '''
+
+        return np.interp(p,self.value["pSat"],self.T,left=np.nan,right=np.nan)
+
+class Tank():
+
+    '''
+    Run Tank Load Estimate (one sample at a time, table lookups only)
+     - Pressure well below saturation --> vapor only; mass from vapor density
+     - Saturated & vented (filling) --> level unknown: bounds only (bound set)
+       (mass <= load w/ liquid at vent dip tube, ullage >= dip tube; load assumed once vent closes)
+     - Saturated & sealed --> mass latched at vent close; ullage follows liquid expansion
+    '''
+
+    def __init__(self,table,volume,ullage,vapLimit=0.9):
+
+        self.table    = table
+        self.volume   = volume   # Internal volume [ft³]
+        self.dipTube  = ullage   # Ullage w/ liquid at vent dip tube (fraction)
+        self.vapLimit = vapLimit # Below vapLimit*pSat --> no liquid
+
+        self.clear()
+
+    def clear(self):
+
+        self.mass   = np.nan # [lb]
+        self.ullage = np.nan # Vapor volume fraction
+        self.load   = None   # Mass latched while sealed [lb]
+        self.bound  = False  # Mass upper & ullage lower bound only (vented)
+
+    def update(self,T,p,vented):
+
+        '''
+        Newest Run Tank Temperature [°F] & Pressure [psi] --> mass & ullage
+        '''
+
+        pSat   = self.table.lookup("pSat",T)
+        rhoLiq = self.table.lookup("rhoLiq",T)
+        rhoVap = self.table.lookup("rhoVap",T)
+
+        self.bound = False
+
+        if (not np.isfinite(pSat)) or (not np.isfinite(p)):
+
+            self.mass   = np.nan
+            self.ullage = np.nan
+
+        elif (p < self.vapLimit*pSat):
+
+            # Superheated vapor --> saturated vapor density scaled to pressure
+            self.mass   = self.volume*rhoVap*p/pSat
+            self.ullage = 1.0
+            self.load   = None
+
+        elif (vented) or (self.load is None):
+
+            # Filling --> level anywhere up to dip tube; full load assumed only once vent closes
+            self.load   = self.volume*(rhoLiq*(1 - self.dipTube) + rhoVap*self.dipTube)
+            self.mass   = self.load
+            self.ullage = self.dipTube
+            self.bound  = vented
+
+        else:
+
+            # Fixed mass; liquid swells as tank warms --> ullage shrinks (0 --> liquid full)
+            self.mass   = self.load
+            self.ullage = min(max((rhoLiq - self.load/self.volume)/(rhoLiq - rhoVap),0.0),1.0)
+
+        return self.mass,self.ullage
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+'''
+Texas A&M University Sounding Rocketry Team
+SRT-9 | 2021-2022
+
+%-------------------------------------------------------------%
+                            TAMU SRT
+  _____                      __  _____          __           __
+ / ___/______  __ _____  ___/ / / ___/__  ___  / /________  / /
+/ (_ / __/ _ \/ // / _ \/ _  / / /__/ _ \/ _ \/ __/ __/ _ \/ /
+\___/_/  \___/\_,_/_//_/\_,_/  \___/\___/_//_/\__/_/  \___/_/
+
+%-------------------------------------------------------------%
+
+Filepath:
+    gc/srt_gc_launchGui/srt_gc_launchReplay.py
+
+Developers:
+    (C) Ground Control Team    20261018
+    (L) Ground Control Team    ########
+
+Description:
+    Recorded session replay; streams ./data/*.dat through the live link pipeline
+    in place of the serial port or TCP socket.
+
+    CLI execution: "python3 srt_gc_launchReplay.py ./data/<file>.dat [speed]"
+    (speed: 1 --> real time, 10 --> 10x, 0 --> as fast as possible)
+
+Input(s):
+    ./data/*.dat    plain-text data archive
+
+Output(s):
+    <None>
+'''
+
+# Installed modules --> Utilities
+import sys
+import time
+import numpy as np
+
+# Program modules
+from srt_gc_launchData import StampParser
+
+class Replay():
+
+    '''
+    Recorded Session Replay Source
+     - Stands in for pyserial port: read(), in_waiting, readline(), write(), close()
+     - Lines released on original "st" time stamps, scaled by speed (0 --> as fast as possible)
+     - Lines w/o stamp released w/ preceding packet; "ERROR: " copies skipped
+    '''
+
+    def __init__(self,fileName,speed=1,timeout=1):
+
+        self.name    = fileName
+        self.speed   = speed
+        self.timeout = timeout # Max. read() block when no line due (sec), as w/ serial port
+
+        stamp = StampParser()
+        line  = []
+        due   = []
+        now   = 0
+
+        with open(fileName,'r') as dataFile:
+
+            for text in dataFile:
+
+                text = text.strip()
+
+                if (len(text) == 0) or (text[0:7] == "ERROR: "):
+                    continue
+
+                if (text[0:2] == "st"):
+                    try:
+                        now = stamp.parse(text.split(',',1)[0][2:])
+                    except ValueError:
+                        pass # Replayed as received; fails in dataUpdate
+
+                line.append(text.encode("ascii",errors="ignore") + b'\n')
+                due.append(now)
+
+        self.line  = line
+        self.due   = np.maximum.accumulate(np.array(due,dtype=np.float64)) if (due) else np.zeros(0)
+        self.index = 0    # Next line to release
+        self.start = None # Wall clock at first read
+        self.pend  = bytearray()
+
+    def release(self):
+
+        '''
+        Move Lines Due by Now Into Read Buffer
+        '''
+
+        if (self.start is None):
+            self.start = time.monotonic()
+
+        if (self.speed <= 0):
+            n = len(self.line)
+        else:
+            n = int(np.searchsorted(self.due,self.elapsed(),side="right"))
+
+        if (n > self.index):
+            self.pend += b''.join(self.line[self.index:n])
+            self.index = n
+
+    def elapsed(self):
+
+        '''
+        Session Time Reached (sec)
+        '''
+
+        return (time.monotonic() - self.start)*self.speed
+
+    @property
+    def in_waiting(self):
+
+        self.release()
+
+        return len(self.pend)
+
+    def done(self):
+
+        '''
+        All Lines Read
+        '''
+
+        return (self.index >= len(self.line)) and (len(self.pend) == 0)
+
+    def read(self,size=1):
+
+        '''
+        Read Up To size Bytes; blocks until next line due or timeout
+        '''
+
+        self.release()
+
+        if (len(self.pend) == 0):
+
+            if (self.index < len(self.line)):
+                wait = (self.due[self.index] - self.elapsed())/self.speed
+            else:
+                wait = self.timeout # Replay finished --> idle port
+
+            time.sleep(min(max(wait,0),self.timeout))
+            self.release()
+
+        text = bytes(self.pend[:size])
+        del self.pend[:size]
+
+        return text
+
+    def readline(self):
+
+        '''
+        Read One Line (or b'' on timeout)
+        '''
+
+        self.release()
+
+        if (b'\n' not in self.pend):
+            self.read(0) # Block until next line due (or timeout)
+
+        end  = self.pend.find(b'\n') + 1
+        text = bytes(self.pend[:end])
+        del self.pend[:end]
+
+        return text
+
+    def write(self,data):
+
+        '''
+        Commands Accepted & Discarded
+        '''
+
+        return len(data)
+
+    def close(self):
+
+        self.index = len(self.line)
+        self.pend  = bytearray()
+
+if (__name__ == '__main__'):
+
+    '''
+    Offline Replay Through Main GUI
+    '''
+
+    from PyQt5.QtWidgets import QApplication
+    from srt_gc_launchGui import Gui
+
+    speed = sys.argv[2] if (len(sys.argv) > 2) else "1"
+
+    app = QApplication(sys.argv)
+    gui = Gui()
+
+    gui.portMenu.setCurrentText("Replay " + sys.argv[1] + ' ' + speed)
+    gui.btnClkConn()
+
+    sys.exit(app.exec_())
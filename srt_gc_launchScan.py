@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+'''
+Texas A&M University Sounding Rocketry Team
+SRT-9 | 2021-2022
+
+%-------------------------------------------------------------%
+                            TAMU SRT
+  _____                      __  _____          __           __
+ / ___/______  __ _____  ___/ / / ___/__  ___  / /________  / /
+/ (_ / __/ _ \/ // / _ \/ _  / / /__/ _ \/ _ \/ __/ __/ _ \/ /
+\___/_/  \___/\_,_/_//_/\_,_/  \___/\___/_//_/\__/_/  \___/_/
+
+%-------------------------------------------------------------%
+
+Filepath:
+    gc/srt_gc_launchGui/srt_gc_launchScan.py
+
+Developers:
+    (C) Ground Control Team    20261018
+    (L) Ground Control Team    ########
+
+Description:
+    Background port & network discovery for the CONNECT drop-down.
+     - Sources scanned in parallel: serial ports (sysfs on Linux), replay files, Wi-Fi networks, TCP endpoints
+     - Results cached per source; only added, changed & removed entries signalled, as each source finishes
+     - Serial ports & replay files re-polled for hot-plug; Wi-Fi & TCP only on request (slow)
+     - TCP endpoint in use by the link not probed (extra connection would hit the router); entry kept
+
+Input(s):
+    <None>
+
+Output(s):
+    <None>
+'''
+
+# Installed modules --> Utilities
+import os
+import shutil
+import socket
+import threading
+import subprocess
+import serial, serial.tools.list_ports
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+# Installed modules --> PyQt related
+from PyQt5.QtCore import (QThread, pyqtSignal)
+
+class ScanThread(QThread):
+
+    '''
+    Discovery Worker
+     - Entries are drop-down text, parsed by btnClkConn (first word --> port)
+     - Keys identify entries across scans: "serial:<dev>", "replay:<file>", "wifi:<ssid>", "tcp:<host>:<port>"
+    '''
+
+    # key, entry; key; no. entries after full scan
+    foundSig = pyqtSignal(str,str)
+    lostSig  = pyqtSignal(str)
+    doneSig  = pyqtSignal(int)
+
+    ttyRoot = "/sys/class/tty"
+
+    def __init__(self,dataDir,endpoints,poll=1.0,timeout=1.0):
+
+        QThread.__init__(self)
+
+        self.dataDir   = dataDir   # Recorded sessions (*.dat)
+        self.endpoints = endpoints # (host, port) TCP probes
+        self.poll      = poll      # Hot-plug poll period (sec)
+        self.timeout   = timeout   # TCP probe connect time (sec)
+
+        self.cache   = {} # Source --> {key: entry}
+        self.busy    = frozenset() # (host, port) endpoints held by link --> not probed
+        self.request = threading.Event() # Full scan requested
+        self.running = True
+
+    def __del__(self):
+
+        self.wait()
+
+    def run(self):
+
+        pool = ThreadPoolExecutor(max_workers=3 + len(self.endpoints))
+        full = True # Full scan on start
+
+        while (self.running):
+
+            # source name, function, arguments
+            jobSpec = [("serial", self.scanSerial, ()),
+                       ("replay", self.scanReplay, ())]
+
+            if (full):
+
+                jobSpec.append(("wifi",self.scanWifi,()))
+
+                busy = self.busy
+
+                for host,port in self.endpoints:
+                    if ((host,port) in busy):
+                        continue # Not rerun --> cached entry kept
+                    jobSpec.append(("tcp:%s:%d" % (host,port),self.scanTcp,(host,port)))
+
+            job  = {pool.submit(spec[1],*spec[2]): spec[0] for spec in jobSpec}
+            pend = set(job)
+
+            # Stream each source as it finishes; failed source keeps cached entries
+            while (pend) and (self.running):
+
+                done, pend = wait(pend,timeout=0.1,return_when=FIRST_COMPLETED)
+
+                for future in done:
+
+                    try:
+                        found = future.result()
+                    except Exception:
+                        continue
+
+                    self.merge(job[future],found)
+
+            if (full) and (self.running):
+                self.doneSig.emit(sum(len(found) for found in self.cache.values()))
+
+            full = self.request.wait(self.poll)
+            self.request.clear()
+
+        pool.shutdown(wait=False)
+
+    def merge(self,source,found):
+
+        '''
+        Signal Differences vs. Cached Source Entries
+        '''
+
+        old = self.cache.get(source,{})
+
+        for key in found:
+            if (old.get(key) != found[key]):
+                self.foundSig.emit(key,found[key])
+
+        for key in old:
+            if (key not in found):
+                self.lostSig.emit(key)
+
+        self.cache[source] = found
+
+    def scanSerial(self):
+
+        '''
+        Serial Ports --> {key: "<device> - <description>"}
+        '''
+
+        if (not os.path.isdir(self.ttyRoot)):
+
+            found = {}
+
+            for port in serial.tools.list_ports.comports():
+                found["serial:" + port.device] = port.device + " - " + port.description
+
+            return found
+
+        # Linux: ports backed by a device (USB, PCI, UART); consoles & ptys skipped
+        found = {}
+
+        for name in os.listdir(self.ttyRoot):
+
+            path   = os.path.join(self.ttyRoot,name)
+            device = os.path.join(path,"device")
+
+            if (not os.path.exists(device)):
+                continue
+
+            if (self.readText(os.path.join(path,"type")) == "0"):
+                continue # Legacy UART slot w/o hardware
+
+            subsystem = os.path.basename(os.path.realpath(os.path.join(device,"subsystem")))
+
+            if (subsystem == "platform"):
+                continue
+
+            device = os.path.realpath(device)
+            text   = None
+
+            # USB adapter (XBee dongle) --> product string of interface's parent device
+            for level in range(3):
+
+                text = self.readText(os.path.join(device,"product"))
+
+                if (text):
+                    break
+
+                device = os.path.dirname(device)
+
+            found["serial:/dev/" + name] = "/dev/" + name + " - " + (text or subsystem)
+
+        return found
+
+    def scanReplay(self):
+
+        '''
+        Recorded Sessions --> "Replay <file> 1" (real-time speed)
+        '''
+
+        found = {}
+
+        if (os.path.isdir(self.dataDir)):
+            for fileName in os.listdir(self.dataDir):
+                if (fileName.endswith(".dat")):
+                    path = os.path.join(self.dataDir,fileName)
+                    found["replay:" + path] = "Replay " + path + " 1"
+
+        return found
+
+    def scanWifi(self):
+
+        '''
+        Visible Wi-Fi Networks --> "Wifi Network: <ssid>" (connects to default router)
+        '''
+
+        if (os.name == "nt"):
+            command = ['netsh','wlan','show','network']
+        elif (shutil.which("nmcli") is not None):
+            command = ['nmcli','-t','-f','SSID','device','wifi','list']
+        else:
+            return {}
+
+        text = subprocess.check_output(command,timeout=10,stderr=subprocess.DEVNULL)
+        text = text.decode('ascii','replace').replace("\r","")
+
+        found = {}
+
+        for line in text.split("\n"):
+
+            line = line.strip()
+
+            if (os.name == "nt"):
+                if (not line.startswith("SSID")):
+                    continue
+                line = line.split(':',1)[-1].strip() # "SSID 1 : <ssid>"
+
+            if (line):
+                found["wifi:" + line] = "Wifi Network: " + line
+
+        return found
+
+    def scanTcp(self,host,port):
+
+        '''
+        TCP Endpoint Accepting Connections --> "Wifi <host>:<port> - TCP"
+        '''
+
+        try:
+            conn = socket.create_connection((host,port),self.timeout)
+            conn.close()
+        except OSError:
+            return {}
+
+        return {"tcp:%s:%d" % (host,port): "Wifi %s:%d - TCP" % (host,port)}
+
+    def readText(self,path):
+
+        try:
+            with open(path) as inFile:
+                return inFile.read().strip()
+        except OSError:
+            return None
+
+    def scan(self):
+
+        '''
+        Request Full Scan (incl. Wi-Fi & TCP); entries kept, differences signalled
+        '''
+
+        self.request.set()
+
+    def hold(self,endpoints):
+
+        '''
+        TCP Endpoints Held by Link (empty --> all probed again); set from GUI thread
+        '''
+
+        self.busy = frozenset(endpoints)
+
+    def stop(self):
+
+        '''
+        Cooperative Shutdown; sources still scanning are abandoned
+        '''
+
+        self.running = False
+        self.request.set()
+        self.wait()
@@ -0,0 +1,379 @@
+# -*- coding: utf-8 -*-
+'''
+Texas A&M University Sounding Rocketry Team
+SRT-9 | 2021-2022
+
+%-------------------------------------------------------------%
+                            TAMU SRT
+  _____                      __  _____          __           __
+ / ___/______  __ _____  ___/ / / ___/__  ___  / /________  / /
+/ (_ / __/ _ \/ // / _ \/ _  / / /__/ _ \/ _ \/ __/ __/ _ \/ /
+\___/_/  \___/\_,_/_//_/\_,_/  \___/\___/_//_/\__/_/  \___/_/
+
+%-------------------------------------------------------------%
+
+Filepath:
+    gc/srt_gc_launchGui/srt_gc_launchSim.py
+
+Developers:
+    (C) Ground Control Team    20261018
+    (L) Ground Control Team    ########
+
+Description:
+    Loopback avionics simulator; stands in for the Ubiquiti router (TCP) & XBee (serial).
+    Answers single-character commands w/ "x..." state codes & streams "st..." data packets
+    from a simple run tank fill model.
+
+    CLI execution: "python3 srt_gc_launchSim.py --tcp 2323 --pty --rate 20"
+    GUI ports:     "Wifi 127.0.0.1:2323" or the printed /dev/pts/N device
+
+Input(s):
+    <None>
+
+Output(s):
+    <None>
+'''
+
+# Installed modules --> Utilities
+import os
+import sys
+import time
+import random
+import socket
+import select
+import argparse
+import threading
+from datetime import datetime
+
+# Program modules
+from srt_gc_launchState import State
+from srt_gc_launchTools import Tools
+
+class Avionics():
+
+    '''
+    Simulated Avionics State & Run Tank Model
+    '''
+
+    # Run tank model constants
+    ambient  = 75.0    # Ambient temperature [F]
+    atm      = 14.7    # Ambient pressure [psi]
+    fillTime = 20*60   # Empty --> full w/ supply & run vent open [sec]
+    tauWarm  = 10*60   # Tank warming time constant [sec]
+    ventCool = 0.03    # Vent evaporative cooling rate [F/sec]
+    burnTime = 8.0     # Full tank burn duration [sec]
+
+    def __init__(self,autostart=False):
+
+        self.tools = Tools()
+        self.lock  = threading.Lock()
+        self.state = {}
+        self.code  = {} # state --> (positive code, negative code)
+
+        for spec in State.stateSpec:
+            self.state[spec[0]] = False
+            self.code[spec[0]]  = (spec[1],spec[2])
+
+        self.state["avPwr"]   = True
+        self.state["data"]    = autostart
+        self.state["ignCont"] = True # Igniter connected --> continuity check passes
+
+        # Command --> internal state change, same table as GUI's acknowledgement (State.ackSpec)
+        self.comm = {}
+
+        for spec in State.ackSpec:
+            self.comm[State.commDict[spec[0]]] = (spec[1],spec[2])
+
+        # Run tank & chamber model
+        self.fill  = 0.0          # Liquid fill fraction [-]
+        self.tTank = self.ambient # Run tank temperature [F]
+        self.pCh   = self.atm     # Chamber pressure [psi]
+
+    def echo(self,state):
+
+        '''
+        State Code for Current Value
+        '''
+
+        return self.code[state][0] if (self.state[state]) else self.code[state][1]
+
+    def command(self,char):
+
+        '''
+        Apply Command --> list of reply lines
+        '''
+
+        with self.lock:
+
+            if (char not in self.comm):
+                return []
+
+            state = self.comm[char][0]
+            value = self.comm[char][1]
+
+            if (state == "abort"):
+
+                # Abort: close fill & igniter paths, drop ready states
+                for name in ["ready1","ready2","supply","ox","ign","ignArm"]:
+                    self.state[name] = False
+
+                return ["xLBabo"]
+
+            if (value is not None):
+                self.state[state] = value
+
+            if (char == '!'):
+                return [self.echo("bvPwr"),self.echo("bv")]
+
+            return [self.echo(state)]
+
+    def step(self,dt):
+
+        '''
+        Advance Tank Model by dt [sec]
+        '''
+
+        with self.lock:
+
+            s = self.state
+
+            # Fill: supply open, faster w/ run tank vent open (liquid displaces vapor)
+            if (s["supply"]):
+                rate       = 1.0 if (s["runVt"]) else 0.2
+                self.fill += rate*dt/self.fillTime
+
+            # Burn: oxidizer & igniter on --> tank drains, chamber pressurizes
+            burning = s["ox"] and s["ign"] and (self.fill > 0)
+
+            if (burning):
+                self.fill -= dt/self.burnTime
+
+            self.fill = min(max(self.fill,0.0),1.0)
+
+            # Temperature: vent boil-off cools, ambient warms
+            self.tTank += (self.ambient - self.tTank)*dt/self.tauWarm
+
+            if (s["runVt"]) and (self.fill > 0):
+                self.tTank -= self.ventCool*dt
+
+            # Pressure: saturated once liquid present, else ambient
+            pSat  = self.tools.vapPress(self.tTank)
+            pTank = self.atm + (pSat - self.atm)*min(self.fill*50,1.0)
+
+            pTarget  = 0.45*pTank if (burning) else self.atm
+            self.pCh += (pTarget - self.pCh)*min(dt/0.2,1.0)
+
+            return pTank
+
+    def packet(self,dt):
+
+        '''
+        Data Packet Line (w/o terminator), None if data stream off
+        '''
+
+        pTank = self.step(dt)
+
+        if (not self.state["data"]) or (not self.state["avPwr"]):
+            return None
+
+        stamp = datetime.now().strftime("%H:%M:%S.%f")
+        noise = random.gauss
+
+        return ("st" + stamp
+                + ",pt" + format(pTank + noise(0,0.5),".2f")
+                + ",pc" + format(self.pCh + noise(0,0.2),".2f")
+                + ",tt" + format(self.tTank + noise(0,0.1),".2f")
+                + ",tc" + format(self.ambient + (self.pCh - self.atm)*0.5 + noise(0,0.1),".2f")
+                + ",ta" + format(self.ambient + noise(0,0.1),".2f"))
+
+class Simulator():
+
+    '''
+    Packet Stream & Command Loopback over TCP server and/or pty serial device
+    '''
+
+    def __init__(self,avionics,rate=10,jitter=0.0,loss=0.0):
+
+        self.avionics = avionics
+        self.rate     = rate   # Packet rate [Hz]
+        self.jitter   = jitter # Packet interval jitter, fraction of period [-]
+        self.loss     = loss   # Packet loss probability [-]
+        self.lock     = threading.Lock()
+        self.sinks    = []     # Write callables of connected links
+        self.sent     = 0
+        self.lost     = 0
+
+    def send(self,text):
+
+        '''
+        Line --> all links; broken links dropped
+        '''
+
+        data = (text + "\r\n").encode("ascii")
+
+        with self.lock:
+            sinks = list(self.sinks)
+
+        for sink in sinks:
+            try:
+                sink(data)
+            except OSError:
+                self.detach(sink)
+
+    def attach(self,sink):
+
+        with self.lock:
+            self.sinks.append(sink)
+
+    def detach(self,sink):
+
+        with self.lock:
+            if (sink in self.sinks):
+                self.sinks.remove(sink)
+
+    def receive(self,data):
+
+        '''
+        Command Bytes --> state echo(s); newlines & XBee bypass keystrokes ignored
+        '''
+
+        for char in data.decode("ascii",errors="ignore"):
+            for text in self.avionics.command(char):
+                self.send(text)
+
+    def run(self):
+
+        '''
+        Packet Loop (blocking)
+        '''
+
+        period = 1.0/self.rate
+        last   = time.monotonic()
+
+        while (True):
+
+            time.sleep(max(period*(1 + random.uniform(-self.jitter,self.jitter)),0))
+
+            now  = time.monotonic()
+            text = self.avionics.packet(now - last)
+            last = now
+
+            if (text is None):
+                continue
+
+            if (random.random() < self.loss):
+                self.lost += 1
+                continue
+
+            self.send(text)
+            self.sent += 1
+
+    def serveTcp(self,host,port):
+
+        '''
+        TCP Server (router stand-in); one reader thread per client
+        '''
+
+        server = socket.socket(socket.AF_INET,socket.SOCK_STREAM)
+        server.setsockopt(socket.SOL_SOCKET,socket.SO_REUSEADDR,1)
+        server.bind((host,port))
+        server.listen(4)
+
+        def client(conn):
+
+            sink = conn.sendall
+            self.attach(sink)
+
+            try:
+                while (True):
+                    data = conn.recv(100)
+                    if (not data):
+                        break
+                    self.receive(data)
+            except OSError:
+                pass
+            finally:
+                self.detach(sink)
+                conn.close()
+
+        def accept():
+
+            while (True):
+                conn,addr = server.accept()
+                threading.Thread(target=client,args=(conn,),daemon=True).start()
+
+        threading.Thread(target=accept,daemon=True).start()
+
+        return server.getsockname()
+
+    def servePty(self):
+
+        '''
+        Pseudo-Terminal Serial Device (XBee stand-in) --> slave device path
+        '''
+
+        import tty
+
+        master,slave = os.openpty()
+        tty.setraw(slave)
+
+        # Non-blocking --> unread slave (no GUI on pty) never stalls packet loop & TCP clients
+        os.set_blocking(master,False)
+
+        def sink(data):
+            try:
+                os.write(master,data)
+            except BlockingIOError:
+                pass # Slave buffer full --> line dropped, as w/ XBee out of range
+
+        def reader():
+
+            while (True):
+                select.select([master],[],[])
+                try:
+                    data = os.read(master,100)
+                except BlockingIOError:
+                    continue
+                except OSError:
+                    break # Slave side closed
+                if (data):
+                    self.receive(data)
+
+        self.attach(sink)
+        threading.Thread(target=reader,daemon=True).start()
+
+        self.slave = slave # Keep open --> master stays readable
+
+        return os.ttyname(slave)
+
+if (__name__ == '__main__'):
+
+    '''
+    Executive Control
+    '''
+
+    parser = argparse.ArgumentParser(description="SRT avionics loopback simulator")
+    parser.add_argument("--host",type=str,default="127.0.0.1",help="TCP bind address")
+    parser.add_argument("--tcp",type=int,default=2323,help="TCP port (0 --> off)")
+    parser.add_argument("--pty",action="store_true",help="create pty serial device")
+    parser.add_argument("--rate",type=float,default=10,help="packet rate [Hz]")
+    parser.add_argument("--jitter",type=float,default=0.0,help="interval jitter, fraction of period")
+    parser.add_argument("--loss",type=float,default=0.0,help="packet loss probability")
+    parser.add_argument("--autostart",action="store_true",help="stream data w/o DATA START")
+    args = parser.parse_args()
+
+    sim = Simulator(Avionics(args.autostart),args.rate,args.jitter,args.loss)
+
+    if (args.tcp > 0):
+        addr = sim.serveTcp(args.host,args.tcp)
+        print("TCP:    Wifi " + addr[0] + ':' + str(addr[1]))
+
+    if (args.pty):
+        print("Serial: " + sim.servePty())
+
+    sys.stdout.flush()
+
+    try:
+        sim.run()
+    except KeyboardInterrupt:
+        pass
@@ -29,6 +29,9 @@ Output(s):
     <outputs?
 '''
 
+# Installed modules --> Utilities
+import numpy as np
+
 class State():
 
     # Control button character commands
@@ -108,7 +111,8 @@ class State():
                  (    "bvPwr",   "xpow1",    "xpow0",    "bvPwr"),
                  (       "bv",  "xbvas1",   "xbvas0",       "bv")]
 
-    stateDict = {} # Initialize state dictionary
+    stateDict  = {} # Initialize state dictionary; code --> (index, value, LED name, pixmap)
+    stateIndex = {} # State name --> index into flag & transition count arrays
 
     for i in range(len(stateSpec)):
 
@@ -117,34 +121,152 @@ class State():
         negCode = stateSpec[i][2]
         ledName = stateSpec[i][3]
 
-        stateDict[posCode] = (state,True,ledName,"green")
-        stateDict[negCode] = (state,False,ledName,"off")
+        stateIndex[state]  = i
+        stateDict[posCode] = (i,True,ledName,"green")
+        stateDict[negCode] = (i,False,ledName,"off")
+
+    # Command acknowledgement: echo confirming each command
+    # command name, state, value (None --> either code, report only)
+
+    # System state
+    ackSpec = [(       "sysArm", "sysArm",  True),
+               (    "sysDisarm", "sysArm", False),
+               (       "ready1", "ready1",  True),
+               (       "ready2", "ready2",  True),
+               (        "abort",  "abort",  None),
+               (       "buzzOn",   "buzz",  True),
+               (      "buzzOff",   "buzz", False),
+    # Data acquisition
+               (    "dataState",   "data",  None),
+               (     "avPwrOff",  "avPwr", False),
+               (    "dataStart",   "data",  True),
+               (     "dataStop",   "data", False),
+    # Fill control
+               (   "supplyOpen", "supply",  True),
+               (  "supplyClose", "supply", False),
+               ( "supplyVtOpen","supplyVt", True),
+               ("supplyVtClose","supplyVt",False),
+               (    "runVtOpen",  "runVt",  True),
+               (   "runVtClose",  "runVt", False),
+               (      "motorOn",  "motor",  True),
+               (     "motorOff",  "motor", False),
+    # Igniter control
+               (      "ignCont","ignCont",  None),
+               (       "ignArm", "ignArm",  True),
+               (    "ignDisarm", "ignArm", False),
+               (       "oxOpen",     "ox",  True),
+               (      "oxClose",     "ox", False),
+               (        "ignOn",    "ign",  True),
+               (       "ignOff",    "ign", False),
+    # Valve control
+               (      "bvPwrOn",  "bvPwr",  True),
+               (     "bvPwrOff",  "bvPwr", False),
+               (       "bvOpen",     "bv",  True),
+               (      "bvClose",     "bv", False),
+               (      "bvState",     "bv",  None),
+               (         "mdot",     "bv",  None)]
+
+    # Safety commands --> sent ahead of all others
+    commSafe = ["abort","sysDisarm","ignDisarm"]
+
+    ackDict  = {"abort": ("xLBabo",)} # Command name --> echo code(s); abort has own code
+    ackState = {} # Command name --> state set (report-only commands excluded)
+    ackUndo  = {} # Command name --> echo code(s) of opposite value
+
+    for spec in ackSpec:
+
+        if (spec[2] is not None):
+            ackState[spec[0]] = spec[1]
+
+        if (spec[1] in stateIndex):
+
+            code = stateSpec[stateIndex[spec[1]]][1:3]
+
+            if (spec[2] is None):
+                ackDict[spec[0]] = tuple(code)
+            else:
+                ackDict[spec[0]] = (code[0] if (spec[2]) else code[1],)
+                ackUndo[spec[0]] = (code[1] if (spec[2]) else code[0],)
 
     def __init__(self,led,ledClr):
 
         self.led    = led    # Gain access to main GUI LED list
         self.ledClr = ledClr # Gain access to LED color pixmaps
 
-        # Defaults internal state(s) to "False"
-        for i in range(len(self.stateSpec)):
-            
-            state = self.stateSpec[i][0]
-            setattr(self,state,False)
+        # Compact state table; internal state(s) default to "False"
+        self.flag  = np.zeros(len(self.stateSpec),dtype=bool)
+        self.count = np.zeros(len(self.stateSpec),dtype=np.int64) # Transitions per state
+
+        # LED repaint bookkeeping: LED name --> pixmap name
+        self.shown = {} # Last painted
+        self.pend  = {} # Awaiting next frame
+
+    def __getattr__(self,name):
+
+        # Only called for missing attributes --> state flags, e.g. self.state.runVt
+        index = State.stateIndex.get(name)
+
+        if (index is not None) and ("flag" in self.__dict__):
+            return bool(self.flag[index])
+
+        raise AttributeError(name)
 
     def update(self,text):
+
+        '''
+        State Code --> flag; LED repaint queued only if state or shown color differs
+        '''
         
         output  = self.stateDict[text]
 
-        state   = output[0]
+        index   = output[0]
         tf      = output[1]
         ledName = output[2]
         pixmap  = output[3]
 
-        # Set internal state True/False
-        setattr(self,state,tf)
+        changed = (self.flag[index] != tf)
+
+        if (changed):
+            self.flag[index]   = tf
+            self.count[index] += 1
+
+        # Re-broadcast of unchanged state only repaints a stale LED (e.g. red after command)
+        if (changed) or (self.pend.get(ledName,self.shown.get(ledName)) != pixmap):
+            self.paint(ledName,pixmap)
+
+        return changed
+
+    def paint(self,ledName,pixmap):
+
+        '''
+        Queue LED Color (last request per LED wins)
+        '''
+
+        self.pend[ledName] = pixmap
+
+    def repaint(self):
+
+        '''
+        Apply Queued LED Colors (once per frame); unchanged colors skipped
+        '''
+
+        for ledName in self.pend:
+
+            pixmap = self.pend[ledName]
+
+            if (self.shown.get(ledName) != pixmap):
+                getattr(self.led,ledName).setPixmap(getattr(self.ledClr,pixmap))
+                self.shown[ledName] = pixmap
+
+        self.pend = {}
+
+    def transitions(self):
+
+        '''
+        Transition Count per State (dict)
+        '''
 
-        # Set LED color w/ corresponding pixmap
-        getattr(self.led,ledName).setPixmap(getattr(self.ledClr,pixmap))
+        return {self.stateSpec[i][0]: int(self.count[i]) for i in range(len(self.stateSpec))}
 
     def btnMap(self,name):
         
@@ -31,7 +31,6 @@ Output(s):
 
 # Installed modules --> PyQt related
 from PyQt5 import QtCore
-import pyqtgraph as pg
 
 # Program modules
 from srt_gc_launchTools import Object
@@ -78,14 +77,16 @@ class Style():
     cssSpec.statusBar = [("font-weight", "normal"), ("font-size", fontSmall)]
     cssSpec.error     = [("font-weight",   "bold"), ("font-size", fontSmall), ("color","red")]
 
-    # Plot line formatting
-    pen      = Object()
+    # Plot line formatting; pens built on first use --> pyqtgraph not imported w/ style
+    penObj   = None     # Container for pyqtgraph pens
+    penSpec  = Object() # " " pen fields: color, line style
     penWidth = 3
 
-    pen.press       = pg.mkPen('r',width=penWidth)
-    pen.pressExtrap = pg.mkPen('r',width=penWidth,style=QtCore.Qt.DotLine)
-    pen.temp        = pg.mkPen('r',width=penWidth)
-    pen.tempExtrap  = pg.mkPen('r',width=penWidth,style=QtCore.Qt.DotLine)
+    penSpec.press       = ('r',QtCore.Qt.SolidLine)
+    penSpec.pressExtrap = ('r',QtCore.Qt.DotLine)
+    penSpec.temp        = ('r',QtCore.Qt.SolidLine)
+    penSpec.tempExtrap  = ('r',QtCore.Qt.DotLine)
+    penSpec.vap         = ('b',QtCore.Qt.DashLine)
 
     def __init__(self):
 
@@ -110,6 +111,26 @@ class Style():
         for i in range(len(name)):   
             setattr(self.css,name[i],style[i]) # Assign CSS style sheet strings
 
+    @property
+    def pen(self):
+
+        '''
+        Plot Pens (pyqtgraph imported on first access)
+        '''
+
+        if (Style.penObj is None):
+
+            import pyqtgraph as pg
+
+            pen = Object()
+
+            for name,spec in self.penSpec.__dict__.items():
+                setattr(pen,name,pg.mkPen(spec[0],width=self.penWidth,style=spec[1]))
+
+            Style.penObj = pen
+
+        return Style.penObj
+
     def setButton(self,color):
 
         '''
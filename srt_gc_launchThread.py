@@ -30,13 +30,17 @@ Output(s):
 '''
 
 # Installed modules --> Utilities
+import os
+import re
+import time
+import queue
+import threading
 import numpy as np
 
 # Installed modules --> PyQt related
 from PyQt5 import (QtGui, QtCore, QtSvg)
 from PyQt5.QtCore import (Qt, QThread, pyqtSignal, QDate, QTime, QDateTime, QSize)
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QDesktopWidget, QPushButton, QApplication, QGroupBox, QGridLayout)
-import pyqtgraph as pg
 
 class UptimeThread(QThread):
 
@@ -110,49 +114,353 @@ class PackThread(QThread):
             else:
                 self.packNum.setText("60")
 
-class SerThread(QThread):
+class WriterThread(QThread):
 
-    outSig   = pyqtSignal(str)
-    stateSig = pyqtSignal(str)
-    dataSig  = pyqtSignal(str)
-    resetSig = pyqtSignal(str)
+    '''
+    Background Buffered File Writer
+     - GUI thread enqueues (file, payload); never blocks on disk I/O
+     - Bounded queue: records dropped & counted when full
+     - Batched writes, periodic flush & fsync
+     - Backpressure (new drops, over half full) reported at most once per reportTime
+    '''
+
+    reportSig = pyqtSignal(int,int) # Queue depth, total dropped records
+
+    def __init__(self,size=10000,flushTime=1,syncTime=10,batchSize=500,reportTime=1):
 
-    def __init__(self,ser):
-        
         QThread.__init__(self)
 
-        self.ser = ser
+        self.queue     = queue.Queue(size)
+        self.lock      = threading.Lock() # Serializes file access w/ release()
+        self.flushTime = flushTime # Max. time written data held in user-space buffers (sec)
+        self.syncTime  = syncTime  # Max. time flushed data held in OS cache (sec)
+        self.batchSize  = batchSize  # Max. records per write pass
+        self.reportTime = reportTime # Min. time between backlog reports (sec)
+
+        self.dropped   = 0
+        self.dropLock  = threading.Lock() # Drops counted from GUI (full) & writer (I/O error) threads
+        self.peak      = 0     # Max. queue depth seen
+        self.reported  = 0     # Dropped count at last report
+        self.running   = True
+        self.dirty     = set() # Files written since last flush
+        self.unsynced  = set() # Files flushed since last fsync
 
     def __del__(self):
 
         self.wait()
 
+    def put(self,target,payload):
+
+        '''
+        Enqueue Record (GUI thread); drops instead of blocking when full
+        '''
+
+        try:
+            self.queue.put_nowait((target,payload))
+        except queue.Full:
+            self.drop(1)
+
+    def drop(self,n):
+
+        with self.dropLock:
+            self.dropped += n
+
+    def backlog(self):
+
+        '''
+        Queue Fill Fraction (backpressure)
+        '''
+
+        return self.queue.qsize()/self.queue.maxsize
+
+    def release(self,targets):
+
+        '''
+        Drain Queue & Hand File(s) Back to Caller (e.g. before close/rename)
+        '''
+
+        self.queue.join()
+
+        with self.lock:
+            for target in targets:
+                self.dirty.discard(target)
+                self.unsynced.discard(target)
+
+    def stop(self):
+
+        '''
+        Cooperative Shutdown; queued records written first
+        '''
+
+        self.running = False
+        self.queue.put((None,None)) # Wake writer
+        self.wait()
+
+    def write(self,items):
+
+        '''
+        Write Batch --> consecutive text records for same file joined into one call
+        '''
+
+        target = None
+        text   = []
+
+        for item in items + [(None,None)]:
+
+            if (text) and ((item[0] is not target) or (not isinstance(item[1],str))):
+                target.write(''.join(text))
+                text = []
+
+            if (item[0] is None):
+                continue
+
+            target = item[0]
+            self.dirty.add(target)
+
+            if (isinstance(item[1],str)):
+                text.append(item[1])
+            else:
+                target.write(item[1])
+
+    def sync(self,fileSet,fsync):
+
+        '''
+        Flush (& optionally fsync) Files
+        '''
+
+        for target in list(fileSet):
+
+            try:
+                target.flush()
+
+                if (fsync):
+                    os.fsync(target.fileno())
+                else:
+                    self.unsynced.add(target)
+
+            except (OSError,ValueError):
+                pass # Closed by owner
+
+        fileSet.clear()
+
     def run(self):
 
-        while (True):
+        lastFlush  = time.monotonic()
+        lastSync   = lastFlush
+        lastReport = None
+
+        while (self.running) or (not self.queue.empty()):
 
+            # Block for first record, then take whatever else is waiting
             try:
+                items = [self.queue.get(timeout=self.flushTime)]
+            except queue.Empty:
+                items = []
+
+            while (items) and (len(items) < self.batchSize):
                 try:
-                    text = self.ser.recv(100)
-                except:
-                    text = self.ser.readline()
- 
-                text = text.decode(errors='ignore').strip() # Error catch for encoding issues
-                self.outSig.emit(text)
+                    items.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            self.peak = max(self.peak,len(items) + self.queue.qsize())
+
+            with self.lock:
+
+                try:
+                    self.write(items)
+                except (OSError,ValueError):
+                    self.drop(len(items)) # Disk full, file closed, ...
+
+                now = time.monotonic()
+
+                if (now - lastFlush >= self.flushTime):
+                    self.sync(self.dirty,False)
+                    lastFlush = now
+
+                if (now - lastSync >= self.syncTime):
+                    self.sync(self.unsynced,True)
+                    lastSync = now
+
+            for item in items:
+                self.queue.task_done()
+
+            # Report backpressure: new drops or over half full, at most once per reportTime
+            # (report's own log record goes through this queue)
+            depth   = self.queue.qsize()
+            dropped = self.dropped
+            now     = time.monotonic()
+
+            due = (lastReport is None) or (now - lastReport >= self.reportTime)
+
+            if (due) and ((dropped != self.reported) or (depth > self.queue.maxsize/2)):
+                self.reported = dropped
+                lastReport    = now
+                self.reportSig.emit(depth,dropped)
+
+        # Final flush & fsync on shutdown
+        with self.lock:
+            self.sync(self.dirty,False)
+            self.sync(self.unsynced,True)
+
+class Framer():
+
+    '''
+    Newline Stream Framing (serial & TCP)
+     - Bytes fed as each link reads them; packets may span read boundaries
+     - Only complete, newline-terminated packets returned
+     - Counts partial (stream joined mid-packet) & garbage (noise, runaway) frames
+    '''
+
+    junk   = re.compile(rb"[^\x20-\x7e\t]") # Non-printable ASCII --> line noise
+    prefix = (b"st",b"x")                    # Packet starts; first frame w/o one is a fragment
+
+    def __init__(self,maxLen=256):
+
+        self.maxLen = maxLen # Longer frames w/o newline discarded as garbage
+
+        self.packets = 0 # Complete lines returned
+        self.partial = 0 # Fragments dropped at stream start (joined mid-packet)
+        self.garbage = 0 # Runaway & non-printable frames dropped
+
+        self.reset()
+
+    def reset(self):
+
+        '''
+        Drop Buffered Bytes (new connection); counts kept for link's lifetime
+        '''
+
+        self.pend   = bytearray() # Bytes after last newline, carried to next read
+        self.synced = False       # First newline seen --> packet boundary known
+
+    def feed(self,data):
+
+        '''
+        Bytes Read by Link --> Complete Packets
+        '''
+
+        self.pend += data
+
+        return self.split()
+
+    def split(self):
+
+        '''
+        Pending Bytes --> Complete Packets (list of str, terminator stripped)
+        '''
+
+        end = self.pend.rfind(b'\n')
+
+        if (end < 0):
+
+            if (len(self.pend) > self.maxLen):
+                self.garbage += 1
+                self.pend     = bytearray()
+
+            return []
+
+        frames = self.pend[:end].split(b'\n')
+        del self.pend[:end + 1]
+
+        # Bytes before first newline may belong to a packet already in flight
+        if (not self.synced):
+
+            self.synced = True
+
+            if (not frames[0].strip().startswith(self.prefix)):
+                head = frames.pop(0).strip()
+
+                if (len(head) > 0):
+                    self.partial += 1
+
+        lines = []
+
+        for frame in frames:
+
+            frame = frame.strip()
+
+            if (len(frame) == 0):
+                continue
+
+            if (len(frame) > self.maxLen) or (self.junk.search(frame)):
+                self.garbage += 1
+                continue
+
+            lines.append(frame.decode("ascii"))
+
+        self.packets += len(lines)
+
+        return lines
+
+class Batcher():
+
+    '''
+    Line Classification & Batching (out, state, data)
+     - Owner provides outSig, stateSig & dataSig
+     - Emits when batchSize lines held, or batchTime elapsed since last emit
+    '''
+
+    def __init__(self,owner,batchTime=0,batchSize=1):
+
+        self.owner     = owner
+        self.batchTime = batchTime # Max. time lines held before emit (sec)
+        self.batchSize = batchSize # Max. no. lines held before emit; 1 --> no batching
+
+        self.out   = []
+        self.state = []
+        self.data  = []
+        self.read  = [] # Per data line read time
+        self.last  = time.monotonic()
+
+    def add(self,lines,read):
+
+        '''
+        Sort Complete Lines, Emit if Batch Full or Due
+        '''
+
+        for text in lines:
+
+            self.out.append(text)
+
+            # 'x' prefix for state update
+            if (text[0] == 'x'):
+                self.state.append(text)
+
+            # "st" prefix for data packet
+            elif (text[0:2] == "st"):
+                self.data.append(text)
+                self.read.append(read)
+
+        self.due()
+
+    def due(self):
+
+        '''
+        Emit if Batch Full or Held Too Long
+        '''
+
+        now = time.monotonic()
+
+        if (len(self.out) >= self.batchSize) or (now - self.last >= self.batchTime):
+            self.flush()
+            self.last = now
 
-                if (len(text) >= 1): # Crashes if empty string
+    def flush(self):
 
-                    # 'x' prefix for state update
-                    if (text[0] == 'x'):
-                        self.stateSig.emit(text)
+        '''
+        Emit Pending Line Batches
+        '''
 
-                    # "st" prefix for data packet
-                    elif (text[0:2] == "st"):
-                        self.dataSig.emit(text)
+        if (self.out):
+            self.owner.outSig.emit(self.out)
+            self.out = []
 
-            except:
+        if (self.state):
+            self.owner.stateSig.emit(self.state)
+            self.state = []
 
-                # Emit read fail signal, then wait until thread terminates
-                # W/o wait, thread will continuously emit and crash main GUI
-                self.resetSig.emit("READ FAIL") 
-                self.sleep(5)
\ No newline at end of file
+        if (self.data):
+            self.owner.dataSig.emit(self.data,self.read,time.perf_counter())
+            self.data = []
+            self.read = []
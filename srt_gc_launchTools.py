@@ -40,8 +40,73 @@ class Object(object):
     
     pass
 
+class Histogram():
+
+    '''
+    Fixed-Bucket Latency Histogram
+     - Log-spaced buckets (perDecade per decade, low to high sec) + under/overflow
+     - Constant memory & cost per sample; percentiles reported as bucket upper edge
+    '''
+
+    def __init__(self,low=1e-5,high=1e2,perDecade=10):
+
+        self.low       = low
+        self.perDecade = perDecade
+        self.nBin      = int(round(np.log10(high/low)*perDecade))
+        self.edge      = low*10.0**(np.arange(self.nBin + 1)/perDecade)
+
+        self.clear()
+
+    def clear(self):
+
+        self.count = np.zeros(self.nBin + 2,dtype=np.int64) # underflow, buckets, overflow
+
+    def total(self):
+
+        return int(self.count.sum())
+
+    def add(self,value,weight=1):
+
+        '''
+        Count Sample(s); scalar or array [sec]
+        '''
+
+        value = np.maximum(np.atleast_1d(value),self.low/10) # Underflow (incl. <= 0) --> bucket 0
+        index = np.floor(np.log10(value/self.low)*self.perDecade).astype(int) + 1
+        index = np.clip(index,0,self.nBin + 1)
+
+        self.count += weight*np.bincount(index,minlength=self.nBin + 2)
+
+    def percentile(self,p):
+
+        '''
+        Upper Bound of p-th Percentile [sec]; None if empty, inf if overflow
+        '''
+
+        total = self.total()
+
+        if (total == 0):
+            return None
+
+        index = int(np.searchsorted(np.cumsum(self.count),p/100.0*total))
+
+        if (index == 0):
+            return self.low
+        elif (index > self.nBin):
+            return np.inf
+        else:
+            return self.edge[index]
+
 class Tools():
 
+    # N2O vapor pressure table: liquid range (triple point to critical point) & spacing [°F]
+    # 0.05 °F spacing --> linear interpolation rel. error ~3e-7 (vapErr)
+    vapRange = [-131.0,97.5]
+    vapStep  = 0.05
+    vapGrid  = None
+    vapTable = None
+    vapErr   = None
+
     def resize(self,grid,rowStretch,colStretch):
 
         '''
@@ -54,28 +119,41 @@ class Tools():
         for i in range(len(colStretch)):
             grid.setColumnStretch(i,colStretch[i])
 
-    def extrap(self,t,x,tq,dt):
+    def decimate(self,x,y,xRange,nPix):
 
         '''
-        Data Extrapolation
+        Peak-Preserving Min/Max Decimation
+         - Clips to visible x range, then keeps min & max of each pixel column
+         - Columns split evenly in x (not sample count) --> irregular spacing, gaps kept in place
+         - NaN (gap) rows propagate to their column's min & max --> line still breaks there
+         - x must be ascending; returns (x,y) untouched if already <= 2 points/pixel
         '''
 
-        # No. past values to use in linear fit
-        n = int(round(tq/dt))
+        # Visible slice, one point margin either side so lines reach plot edge
+        i0 = max(np.searchsorted(x,xRange[0]) - 1,0)
+        i1 = min(np.searchsorted(x,xRange[1]) + 1,len(x))
 
-        if (n < len(t)):
+        x = x[i0:i1]
+        y = y[i0:i1]
 
-            # Use all past packets
-            dxdt = (x[-1] - x[-n])/(t[-1] - t[-n])
+        nPix = max(int(nPix),1)
 
-        else:
+        if (len(x) <= 2*nPix):
+            return x,y
+
+        # Bucket edges: one bucket per pixel column, empty columns dropped (reduceat needs ascending starts)
+        edge    = np.searchsorted(x,np.linspace(xRange[0],xRange[1],nPix + 1))
+        edge[0] = 0 # Left margin point joins first column
+        edge    = edge[:-1][edge[:-1] < edge[1:]]
 
-            # Only use past n packets
-            dxdt = (x[-1] - x[0])/(t[-1] - t[0])
+        yMin = np.minimum.reduceat(y,edge)
+        yMax = np.maximum.reduceat(y,edge)
 
-        xq = x[-1] + tq*dxdt
+        # Vertical min --> max stroke per column, newest sample kept exact
+        xDec = np.append(np.repeat(x[edge],2),x[-1])
+        yDec = np.append(np.column_stack((yMin,yMax)).ravel(),y[-1])
 
-        return xq
+        return xDec,yDec
 
     def vapPress(self,T0):
 
@@ -92,4 +170,34 @@ class Tools():
         pSat0  = np.exp(G[0] + G[1]/T0 + G[2]*np.log(T0) + G[3]*pow(T0,G[4])) # Initial vapor pressure of N2O [Pa]
         pSat0  = pSat0*pa2psi
 
-        return pSat0
\ No newline at end of file
+        return pSat0
+
+    def vapInit(self):
+
+        '''
+        N2O Vapor Pressure Table --> closed form sampled once on uniform grid
+         - vapErr: max. relative interpolation error, checked at cell midpoints
+        '''
+
+        n = int(round((self.vapRange[1] - self.vapRange[0])/self.vapStep)) + 1
+        T = self.vapRange[0] + self.vapStep*np.arange(n)
+
+        table = self.vapPress(T)
+        mid   = self.vapPress(T[:-1] + self.vapStep/2)
+
+        # Shared by all instances
+        Tools.vapErr   = float(np.max(np.abs(0.5*(table[:-1] + table[1:])/mid - 1)))
+        Tools.vapGrid  = T
+        Tools.vapTable = table
+
+    def vapLookup(self,T0):
+
+        '''
+        Table N2O Vapor Pressure [psi] (scalar or array, °F); NaN outside liquid range
+        '''
+
+        if (self.vapTable is None):
+            self.vapInit()
+
+        # Single compiled pass: bracket, linear interpolation, range mask
+        return np.interp(T0,self.vapGrid,self.vapTable,left=np.nan,right=np.nan)
\ No newline at end of file
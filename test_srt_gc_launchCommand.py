@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+'''
+Texas A&M University Sounding Rocketry Team
+SRT-9 | 2021-2022
+
+%-------------------------------------------------------------%
+                            TAMU SRT
+  _____                      __  _____          __           __
+ / ___/______  __ _____  ___/ / / ___/__  ___  / /________  / /
+/ (_ / __/ _ \/ // / _ \/ _  / / /__/ _ \/ _ \/ __/ __/ _ \/ /
+\___/_/  \___/\_,_/_//_/\_,_/  \___/\___/_//_/\__/_/  \___/_/
+
+%-------------------------------------------------------------%
+
+Filepath:
+    gc/srt_gc_launchGui/test_srt_gc_launchCommand.py
+
+Developers:
+    (C) Ground Control Team    20261018
+    (L) Ground Control Team    ########
+
+Description:
+    CommandQueue checks: opposite commands supersede stale sends & resends.
+    CLI execution: "python3 -m pytest test_srt_gc_launchCommand.py"
+
+Input(s):
+    <None>
+
+Output(s):
+    <None>
+'''
+
+# Installed modules --> Utilities
+import time
+import asyncio
+
+# Program modules
+from srt_gc_launchState   import State
+from srt_gc_launchCommand import CommandQueue
+
+class Owner():
+
+    '''
+    Link Thread Stand-In: records writes & command events
+    '''
+
+    def __init__(self):
+
+        self.wire    = [] # Bytes written, in order
+        self.event   = [] # (command name, event)
+        self.commSig = self
+
+    def emit(self,name,event,latency,tries):
+
+        self.event.append((name,event))
+
+    def commWrite(self,link,data):
+
+        self.wire.append(data)
+        return True
+
+def comm(name):
+
+    return State.commDict[name].encode("ascii")
+
+def run(queue,steps):
+
+    '''
+    Run (delay, action) Steps on a Fresh Event Loop
+    '''
+
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    async def script():
+        for delay,action in steps:
+            await asyncio.sleep(delay)
+            action()
+
+    try:
+        loop.run_until_complete(script())
+    finally:
+        loop.close()
+
+def test_disarm_supersedes_arm_resend():
+
+    # Arm unacknowledged, disarm sent & acknowledged --> arm never resent
+    owner = Owner()
+    queue = CommandQueue(owner,gap=0.01,ackTime=0.05,retries=2)
+
+    run(queue,[(0.00, lambda: queue.put("XBee","ignArm",comm("ignArm"))),
+               (0.02, lambda: queue.put("XBee","ignDisarm",comm("ignDisarm"))),
+               (0.01, lambda: queue.match(["xign0"],time.perf_counter())),
+               (0.30, lambda: None)])
+
+    assert owner.wire == [comm("ignArm"),comm("ignDisarm")]
+    assert ("ignArm","SUPERSEDED") in owner.event
+    assert ("ignDisarm","ACK") in owner.event
+    assert ("ignArm","RETRY") not in owner.event
+
+def test_opposite_echo_cancels_waiting_command():
+
+    # Arm sent, board reports disarmed (e.g. other ground station) --> no resend
+    owner = Owner()
+    queue = CommandQueue(owner,gap=0.01,ackTime=0.05,retries=2)
+
+    run(queue,[(0.00, lambda: queue.put("XBee","sysArm",comm("sysArm"))),
+               (0.01, lambda: queue.match(["xsys0"],time.perf_counter())),
+               (0.30, lambda: None)])
+
+    assert owner.wire == [comm("sysArm")]
+    assert owner.event == [("sysArm","SENT"),("sysArm","SUPERSEDED")]
+
+def test_unacknowledged_command_resent():
+
+    # No echo --> resent up to retries, then timed out
+    owner = Owner()
+    queue = CommandQueue(owner,gap=0.01,ackTime=0.05,retries=2)
+
+    run(queue,[(0.00, lambda: queue.put("XBee","ignArm",comm("ignArm"))),
+               (0.40, lambda: None)])
+
+    assert owner.wire == [comm("ignArm")]*3
+    assert owner.event[-1] == ("ignArm","TIMEOUT")
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+'''
+Texas A&M University Sounding Rocketry Team
+SRT-9 | 2021-2022
+
+%-------------------------------------------------------------%
+                            TAMU SRT
+  _____                      __  _____          __           __
+ / ___/______  __ _____  ___/ / / ___/__  ___  / /________  / /
+/ (_ / __/ _ \/ // / _ \/ _  / / /__/ _ \/ _ \/ __/ __/ _ \/ /
+\___/_/  \___/\_,_/_//_/\_,_/  \___/\___/_//_/\__/_/  \___/_/
+
+%-------------------------------------------------------------%
+
+Filepath:
+    gc/srt_gc_launchGui/test_srt_gc_launchLink.py
+
+Developers:
+    (C) Ground Control Team    20261018
+    (L) Ground Control Team    ########
+
+Description:
+    LinkGroup checks: merged stream stays in stamp order; late & loss counts per member.
+    CLI execution: "python3 -m pytest test_srt_gc_launchLink.py"
+
+Input(s):
+    <None>
+
+Output(s):
+    <None>
+'''
+
+# Program modules
+from srt_gc_launchLink import LinkGroup
+from srt_gc_launchData import StampParser
+
+class Member():
+
+    '''
+    Link Stand-In: name & phase only
+    '''
+
+    def __init__(self,name):
+
+        self.name      = name
+        self.connected = True
+        self.phase     = "reading"
+
+def packet(i,start=12*3600):
+
+    '''
+    Data Line of Packet i (AV clock at 20 Hz from start sec)
+    '''
+
+    now = start + 0.05*i
+
+    return "st%02d:%02d:%09.6f,pt%d" % (now//3600,now%3600//60,now%60,400 + i%50)
+
+def feed(group,steps):
+
+    '''
+    Run (member, lines) Steps through Group --> forwarded lines, in order
+    '''
+
+    out = []
+
+    for n,(link,lines) in enumerate(steps):
+        out += group.filter(link,lines,0.01*n)
+
+    return out
+
+def stamps(lines):
+
+    parser = StampParser()
+
+    return [parser.parse(text.split(',',1)[0][2:]) for text in lines]
+
+def increasing(values):
+
+    return all(b > a for a,b in zip(values,values[1:]))
+
+def test_interleaved_members_merge_in_order():
+
+    # Members alternate who delivers first; B misses every 4th packet
+    a,b   = Member("XBee"),Member("Wifi")
+    group = LinkGroup(None,"Dual",[a,b])
+    steps = []
+    gap   = [] # Missed by B while B ahead --> A's copy behind newest stamp, late
+
+    for k in range(40):
+
+        lines = [packet(i) for i in range(5*k,5*k + 5)]
+        part  = [lines[i] for i in range(5) if ((5*k + i)%4 != 3)]
+
+        if (k%2 == 0):
+            steps += [(a,lines),(b,part)]
+        else:
+            steps += [(b,part),(a,lines)]
+            gap   += [i for i in range(5*k,5*k + 4) if (i%4 == 3)]
+
+    out = feed(group,steps)
+
+    assert out == [packet(i) for i in range(200) if (i not in gap)]
+    assert increasing(stamps(out))
+
+    stat = group.stat
+    assert len(gap) == 20
+    assert group.forwarded == 180
+    assert stat["XBee"].late == len(gap)
+    assert stat["Wifi"].late == 0
+    assert stat["XBee"].first + stat["Wifi"].first == 180
+    assert stat["XBee"].loss(group.forwarded) == 0
+    assert stat["Wifi"].loss(group.forwarded) == 1 - 150/180
+
+def test_lagging_member_counted_late():
+
+    # B trails A by 100 packets (> 64 packet window) --> copies late, never forwarded
+    a,b   = Member("XBee"),Member("Wifi")
+    group = LinkGroup(None,"Dual",[a,b])
+    steps = []
+
+    for i in range(200):
+        steps.append((a,[packet(i)]))
+        if (i >= 100):
+            steps.append((b,[packet(i - 100)]))
+
+    steps += [(b,[packet(i)]) for i in range(100,200)]
+
+    out = feed(group,steps)
+
+    assert out == [packet(i) for i in range(200)]
+    assert increasing(stamps(out))
+
+    # Window after A's last packet: 136..199 --> 100..135 also late, rest duplicates
+    stat = group.stat
+    assert stat["Wifi"].late == 136
+    assert stat["Wifi"].first == 0
+    assert stat["XBee"].first == 200
+    assert stat["Wifi"].loss(group.forwarded) == 0
+
+def test_clock_reset_starts_new_stream():
+
+    # AV restarts 60 s in --> stamps jump back; B trails by 5 packets across reset
+    a,b   = Member("XBee"),Member("Wifi")
+    group = LinkGroup(None,"Dual",[a,b])
+    sent  = [packet(i) for i in range(1200)] + [packet(i) for i in range(200)]
+    steps = []
+
+    for i in range(len(sent)):
+        steps.append((a,[sent[i]]))
+        if (i >= 5):
+            steps.append((b,[sent[i - 5]]))
+
+    out = feed(group,steps)
+
+    assert out == sent
+    assert increasing(stamps(out[:1200]))
+    assert increasing(stamps(out[1200:]))
+
+    stat = group.stat
+    assert group.forwarded == 1400
+    assert stat["XBee"].late == stat["Wifi"].late == 0
+    assert stat["Wifi"].loss(group.forwarded) == 1 - 1395/1400